@@ -0,0 +1,51 @@
+import argparse
+import logging
+import os
+import sys
+
+from benchmarks import cases  # noqa: F401 registers the benchmarks
+from benchmarks.runner import (
+    DEFAULT_THRESHOLD,
+    compare,
+    load_baseline,
+    run_benchmarks,
+    save_baseline,
+)
+from core.game import Game
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+parser = argparse.ArgumentParser(
+    description="Time the game's hot paths and compare them with a baseline"
+)
+parser.add_argument("-k", "--filter", help="only run benchmarks containing this")
+parser.add_argument("--baseline", default=BASELINE_PATH)
+parser.add_argument(
+    "--save", action="store_true", help="record the results as the new baseline"
+)
+parser.add_argument(
+    "--threshold",
+    type=float,
+    default=DEFAULT_THRESHOLD,
+    help="fail when a result is this fraction slower than its baseline",
+)
+args = parser.parse_args()
+
+# Keep the game's own logging out of the results
+logging.getLogger().setLevel(logging.WARNING)
+
+game = Game(width=1366, height=768, title="Benchmarks", headless=True, seed=0)
+results = run_benchmarks(game, args.filter)
+game.gc_policy.close()
+
+if args.save:
+    save_baseline(args.baseline, results)
+    print(f"Saved baseline to {args.baseline}")
+elif os.path.exists(args.baseline):
+    print()
+    regressions = compare(results, load_baseline(args.baseline), args.threshold)
+    if regressions:
+        print(f"{len(regressions)} benchmarks regressed past {args.threshold:.0%}")
+        sys.exit(1)
+else:
+    print(f"No baseline at {args.baseline}, run with --save to record one")
@@ -0,0 +1,242 @@
+import logging
+import random
+from itertools import cycle
+
+import pygame
+
+from benchmarks.runner import benchmark
+from core.background import Background
+from core.font import Font, text_cache
+from core.game_clock import GameClock
+from core.glyph_atlas import GlyphAtlas
+from core.ground import Ground
+from core.obstacle_manager import ObstacleManager
+from core.player import Player
+from core.render_queue import RenderQueue
+from core.resolution import RENDER_SCALES
+from core.text import Text
+from core.tiling_background import BRICKS_IMAGE, BRICKS_UNIT_SIZE, TilingBackground
+
+OBSTACLE_COUNTS = (10, 100, 1000, 10000)
+SCENARIO_FRAMES = 300
+
+
+def _score_font():
+    return Font(
+        "antiquity-print.ttf",
+        39,
+        (255, 255, 255),
+        shadow=True,
+        shadow_offset=(2, 2),
+    )
+
+
+@benchmark("font.render cached", number=20000)
+def font_render_cached(game):
+    font = _score_font()
+    return lambda: font.render("Score: 042")
+
+
+@benchmark("font.render uncached", number=500)
+def font_render_uncached(game):
+    font = _score_font()
+
+    def render():
+        text_cache.clear()
+        font.render("Score: 042")
+
+    return render
+
+
+@benchmark("text.render", number=5000)
+def text_render(game):
+    text = Text("Press P or ESC to pause", _score_font(), position=(20, 20))
+    return lambda: text.render(game.screen)
+
+
+@benchmark("glyph_atlas.draw", number=5000)
+def glyph_atlas_draw(game):
+    atlas = GlyphAtlas.for_font(_score_font(), charset="Score: High0123456789")
+    return lambda: atlas.draw(game.screen, "High Score: 042", (20, 90))
+
+
+@benchmark("background.render", number=500)
+def background_render(game):
+    background = Background(image="menu_1.png")
+    return lambda: background.render(game.screen)
+
+
+@benchmark("tiling_background.render", number=500)
+def tiling_background_render(game):
+    background = TilingBackground(
+        BRICKS_IMAGE, BRICKS_UNIT_SIZE, view_size=(game.width, game.height)
+    )
+
+    def render():
+        background.layer.scroll(5)
+        background.render(game.screen)
+
+    return render
+
+
+@benchmark("ground.render", number=2000)
+def ground_render(game):
+    ground = Ground(game.width, game.height, game.height - 100, parallax=2)
+
+    def render():
+        ground.layer.scroll(5)
+        ground.render(game.screen)
+
+    return render
+
+
+def _obstacle_manager(game, backend: str, count: int, start_x: int):
+    # Without a jump arc the schedule spawns a few obstacles on top while
+    # timing updates, which adds little to these counts
+    args = (game.width, game.height - 100, GameClock(), random.Random(0))
+    if backend == "batch":
+        from core.obstacle_batch import ObstacleBatch
+
+        manager = ObstacleBatch(*args)
+        for i in range(count):
+            manager.add(start_x + i * 10, manager._choose_obstacle()[1])
+        return manager
+
+    manager = ObstacleManager(*args)
+    for i in range(count):
+        obstacle = manager._spawn_obstacle(*manager._choose_obstacle())
+        # Placed like the batch backend's rows, as if spawned there
+        obstacle.reset(start_x + i * 10, obstacle.y, obstacle.texture)
+        manager.obstacles.append(obstacle)
+    return manager
+
+
+def _register_obstacle_benchmarks(backend: str, name: str, count: int):
+    updates = 200
+
+    @benchmark(f"{name}.update {count} obstacles", number=updates)
+    def update(game):
+        # Far enough right that none leave the screen while timing
+        manager = _obstacle_manager(game, backend, count, game.width + updates * 10)
+        return manager.update
+
+    @benchmark(f"{name}.check_collisions {count} obstacles", number=500)
+    def check_collisions(game):
+        manager = _obstacle_manager(game, backend, count, 0)
+        # Above the obstacles, so none collide and the whole x-range is checked
+        player_rect = pygame.Rect(100, -200, 50, 80)
+        return lambda: manager.check_collisions(player_rect)
+
+    @benchmark(f"{name}.check_collisions masked {count} obstacles", number=500)
+    def check_collisions_masked(game):
+        manager = _obstacle_manager(game, backend, count, 60)
+        # Standing among the obstacles, so candidates get a pixel test
+        player = Player(100, manager.ground_level)
+        player.rect.bottom = manager.ground_level
+        shape = player.collision_shape()
+        return lambda: manager.check_collisions(*shape)
+
+    @benchmark(f"{name}.draw {count} obstacles", number=50)
+    def draw(game):
+        # The first screen width of obstacles is visible
+        manager = _obstacle_manager(game, backend, count, 0)
+        queue = RenderQueue(game.screen)
+
+        def render():
+            manager.draw(queue, 0.5)
+            queue.flush()
+
+        return render
+
+
+for backend, name in (("objects", "obstacle_manager"), ("batch", "obstacle_batch")):
+    for count in OBSTACLE_COUNTS:
+        _register_obstacle_benchmarks(backend, name, count)
+
+
+@benchmark("sound_controller.update", number=20000, unit="sample")
+def sound_controller_update(game):
+    from core.sound_controller import SoundController
+
+    # There is no sensor, the serial thread only logs that and exits
+    logging.getLogger("SoundController").disabled = True
+    config = {
+        "window_size": 150,
+        "z_threshold": 3.0,
+        "holdoff_time": 0.2,
+        "sensitivity": 0.50,
+        "port": "no-sensor",
+        "baudrate": 115200,
+        "noise_floor": 100,
+    }
+    controller = SoundController(config, jump_callback=None)
+    controller.stop()
+
+    rng = random.Random(0)
+    samples = cycle([int(rng.gauss(400, 60)) for _ in range(1000)])
+    next_sample = samples.__next__
+    return lambda: controller.update(next_sample())
+
+
+@benchmark("scenario.menu", number=SCENARIO_FRAMES, repeat=3, unit="frame")
+def menu_scenario(game):
+    from core.state.menu_state import MenuState
+
+    game.set_state(MenuState(game))
+    return game.step_frame
+
+
+def _play_frames(game):
+    """Set up PlayState, returning a function that plays one frame."""
+    from core.state.play_state import PlayState
+
+    game.rng.seed(0)
+    game.set_state(PlayState(game))
+    jump = [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE)]
+
+    def frame():
+        state = game.state
+        if not isinstance(state, PlayState):
+            # Keep timing gameplay frames after a collision
+            state = PlayState(game)
+            game.set_state(state)
+
+        # Jump at obstacles about to reach the player
+        player = state.player.rect
+        ahead = any(
+            0 < obstacle.rect.left - player.right < 60
+            for obstacle in state.obstacle_manager.obstacles
+        )
+        game.step_frame(jump if ahead and state.player.is_grounded else ())
+
+    return frame
+
+
+@benchmark("scenario.play", number=SCENARIO_FRAMES, repeat=3, unit="frame")
+def play_scenario(game):
+    game.set_render_scale(1.0)
+    return _play_frames(game)
+
+
+def _register_render_scale_benchmark(scale: float):
+    @benchmark(
+        f"scenario.play presented at render scale {scale}",
+        number=SCENARIO_FRAMES,
+        repeat=3,
+        unit="frame",
+    )
+    def presented(game):
+        # Headless games skip presenting, so it is timed here, upscale
+        # included. A lower scale only pays off when its frames are faster.
+        game.set_render_scale(scale)
+        frame = _play_frames(game)
+
+        def presented_frame():
+            frame()
+            game._present(None)
+
+        return presented_frame
+
+
+for scale in RENDER_SCALES:
+    _register_render_scale_benchmark(scale)
@@ -0,0 +1,104 @@
+import json
+import platform
+import time
+from datetime import datetime, timezone
+
+import pygame
+
+# Registered benchmarks, in the order they run
+BENCHMARKS = []
+
+# A result this much slower than its baseline fails the run
+DEFAULT_THRESHOLD = 0.15
+
+
+class Benchmark:
+    """A timed operation.
+
+    `setup(game)` prepares fresh state and returns the operation to time.
+    Each of `repeat` rounds calls setup again and then the operation
+    `number` times. The fastest round is reported, as slower rounds are
+    other processes getting in the way, not the code being measured.
+    """
+
+    def __init__(self, name, setup, number, repeat, unit):
+        self.name = name
+        self.setup = setup
+        self.number = number
+        self.repeat = repeat
+        self.unit = unit
+
+    def run(self, game) -> float:
+        """Time the benchmark, returning microseconds per operation."""
+        best = float("inf")
+        for _ in range(self.repeat):
+            operation = self.setup(game)
+            operation()  # Warm up caches outside the timed loop
+            start = time.perf_counter()
+            for _ in range(self.number):
+                operation()
+            best = min(best, time.perf_counter() - start)
+        return best / self.number * 1e6
+
+
+def benchmark(name, number=1000, repeat=5, unit="op"):
+    """Register a setup function as a benchmark."""
+
+    def register(setup):
+        BENCHMARKS.append(Benchmark(name, setup, number, repeat, unit))
+        return setup
+
+    return register
+
+
+def run_benchmarks(game, pattern=None) -> dict:
+    results = {}
+    for bench in BENCHMARKS:
+        if pattern and pattern not in bench.name:
+            continue
+        us_per_op = bench.run(game)
+        results[bench.name] = {"us_per_op": us_per_op, "unit": bench.unit}
+        print(
+            f"{bench.name:<56} {us_per_op:12.2f} us/{bench.unit}"
+            f" {1e6 / us_per_op:14,.0f} {bench.unit}/s"
+        )
+    return results
+
+
+def environment() -> dict:
+    return {
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "machine": platform.node(),
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+    }
+
+
+def save_baseline(path, results):
+    with open(path, "w") as f:
+        json.dump({"environment": environment(), "results": results}, f, indent=2)
+        f.write("\n")
+
+
+def load_baseline(path) -> dict:
+    with open(path) as f:
+        return json.load(f)["results"]
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD) -> list:
+    """Print each result against its baseline, returning the regressions."""
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            print(f"{name:<56} no baseline")
+            continue
+        ratio = result["us_per_op"] / baseline[name]["us_per_op"]
+        status = "ok"
+        if ratio > 1 + threshold:
+            status = "REGRESSION"
+            regressions.append(name)
+        elif ratio < 1 - threshold:
+            status = "faster"
+        print(f"{name:<56} {ratio:8.2f}x baseline time  {status}")
+    return regressions
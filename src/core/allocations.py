@@ -0,0 +1,150 @@
+import fnmatch
+import gc
+import os
+import re
+import time
+import tracemalloc
+from collections import defaultdict
+
+from core.logs import get_logger
+
+logger = get_logger("Allocations")
+
+# Source lines listed per state in the session report
+TOP_LINES = 15
+
+# Allocations made by the tracking itself, including the patterns the
+# filters compile, are left out of the counts
+_IGNORED = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, fnmatch.__file__),
+    tracemalloc.Filter(False, os.path.join(os.path.dirname(re.__file__), "*")),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+class StateAllocations:
+    """Allocation totals of the frames of one state."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.frames = 0
+        self.blocks = 0
+        self.bytes = 0
+        self.transient_bytes = 0
+        self.collections = 0
+        self.gc_pause_ms = 0.0
+        self.worst_gc_pause_ms = 0.0
+        # Source line -> [blocks, bytes]
+        self.lines = defaultdict(lambda: [0, 0])
+
+    def summary(self) -> str:
+        frames = max(self.frames, 1)
+        return (
+            f"{self.name}: {self.frames} frames, "
+            f"{self.blocks / frames:.1f} blocks and {self.bytes / frames:,.0f} B "
+            f"kept per frame, {self.transient_bytes / frames:,.0f} B transient "
+            f"per frame, {self.collections} collections, "
+            f"{self.gc_pause_ms:.2f} ms in GC ({self.worst_gc_pause_ms:.2f} ms worst)"
+        )
+
+
+class AllocationTracker:
+    """Counts the memory each frame allocates, per state and source line.
+
+    At the end of a frame, tracemalloc is compared with the frame's start.
+    That gives the blocks the frame allocated which are still alive, e.g.
+    objects that are stored until a later frame replaces them. Temporaries
+    that are freed within the frame do not show up there. They raise the
+    traced peak instead, which is reported as transient bytes. gc
+    callbacks time the collections, which happen more often the more
+    container objects frames churn through.
+    """
+
+    def __init__(self, top_lines: int = TOP_LINES):
+        self.top_lines = top_lines
+        self.states = {}
+        self._state = None
+        self._snapshot = None
+        self._start_bytes = 0
+        self._gc_start = None
+        # Set while snapshotting, whose collections are not the frame's
+        self._measuring = False
+
+    def start(self):
+        # Only allocations made from here on are traced, so the assets
+        # loaded during startup do not slow down the snapshots
+        tracemalloc.start()
+        gc.callbacks.append(self._on_gc)
+        logger.info("Tracking allocations per frame")
+
+    def stop(self):
+        if self._on_gc in gc.callbacks:
+            gc.callbacks.remove(self._on_gc)
+        tracemalloc.stop()
+
+    def begin_frame(self, state_name: str):
+        state = self.states.get(state_name)
+        if state is None:
+            state = self.states[state_name] = StateAllocations(state_name)
+        self._state = state
+        self._measuring = True
+        try:
+            self._snapshot = tracemalloc.take_snapshot().filter_traces(_IGNORED)
+        finally:
+            self._measuring = False
+        self._start_bytes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+
+    def end_frame(self):
+        # Read the peak before the snapshot allocates
+        peak = tracemalloc.get_traced_memory()[1]
+        self._measuring = True
+        try:
+            snapshot = tracemalloc.take_snapshot().filter_traces(_IGNORED)
+            stats = snapshot.compare_to(self._snapshot, "lineno")
+        finally:
+            self._measuring = False
+
+        state = self._state
+        state.frames += 1
+        state.transient_bytes += max(0, peak - self._start_bytes)
+        for stat in stats:
+            if stat.count_diff <= 0:
+                continue
+            frame = stat.traceback[0]
+            line = state.lines[f"{frame.filename}:{frame.lineno}"]
+            line[0] += stat.count_diff
+            line[1] += stat.size_diff
+            state.blocks += stat.count_diff
+            state.bytes += stat.size_diff
+        self._snapshot = None
+
+    def _on_gc(self, phase: str, info: dict):
+        if self._measuring:
+            return
+        if phase == "start":
+            self._gc_start = time.perf_counter()
+        elif self._gc_start is not None and self._state is not None:
+            pause_ms = (time.perf_counter() - self._gc_start) * 1000
+            self._state.collections += 1
+            self._state.gc_pause_ms += pause_ms
+            self._state.worst_gc_pause_ms = max(self._state.worst_gc_pause_ms, pause_ms)
+            self._gc_start = None
+
+    def report(self) -> str:
+        """The per-state totals, each with the source lines allocating most."""
+        lines = ["Allocations per frame by state:"]
+        for state in self.states.values():
+            lines.append(state.summary())
+            frames = max(state.frames, 1)
+            top = sorted(state.lines.items(), key=lambda item: -item[1][0])
+            for location, (blocks, size) in top[: self.top_lines]:
+                lines.append(
+                    f"  {blocks / frames:8.2f} blocks {size / frames:10,.0f} B"
+                    f"  {location}"
+                )
+        return "\n".join(lines)
@@ -0,0 +1,130 @@
+import os
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+
+import pygame
+
+from core.logs import get_logger
+
+logger = get_logger("ImageRegistry")
+
+ASSETS_DIR = Path(__file__).parent.parent.parent / "assets"
+
+# Default memory budget for decoded surfaces (bytes)
+DEFAULT_BUDGET = 256 * 1024 * 1024
+
+
+def asset_path(*parts) -> Path:
+    """Resolve a path relative to the assets directory."""
+    return ASSETS_DIR.joinpath(*parts)
+
+
+@lru_cache(maxsize=None)
+def list_assets(*parts, suffix=".png") -> tuple[Path, ...]:
+    """List the files of an asset directory once per process."""
+    dir_path = asset_path(*parts)
+    if not dir_path.is_dir():
+        return ()
+    return tuple(
+        dir_path / file_name
+        for file_name in sorted(os.listdir(dir_path))
+        if file_name.endswith(suffix)
+    )
+
+
+class ImageRegistry:
+    """Process-wide cache of decoded and scaled surfaces.
+
+    Surfaces are keyed by (path, target size, source area) and evicted in
+    least-recently-used order once the memory budget is exceeded. Cached
+    surfaces are shared, so callers must not draw onto them.
+    """
+
+    _instance = None
+
+    @classmethod
+    def get_instance(cls):
+        """Singleton pattern to share one registry across all states"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, budget_bytes: int = DEFAULT_BUDGET):
+        self.budget_bytes = budget_bytes
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._surfaces = OrderedDict()
+
+    @staticmethod
+    def make_key(path, size=None, area=None) -> tuple:
+        return (
+            os.path.abspath(path),
+            tuple(size) if size else None,
+            tuple(area) if area else None,
+        )
+
+    def load(self, path, size=None, area=None) -> pygame.Surface:
+        """Return the image at `path`, cropped to `area` and scaled to `size`."""
+        key = self.make_key(path, size, area)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        if area:
+            # Crop from the cached source so sprite sheets are decoded once
+            surface = self.load(path).subsurface(area)
+        else:
+            surface = pygame.image.load(key[0])
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert_alpha()
+            logger.debug(f"Decoded image {key[0]}")
+
+        if size and surface.get_size() != tuple(size):
+            surface = pygame.transform.scale(surface, size)
+        elif area:
+            surface = surface.copy()
+
+        self.put(key, surface)
+        return surface
+
+    def put(self, key: tuple, surface: pygame.Surface):
+        """Store a surface under `key`, evicting old entries past the budget."""
+        if key in self._surfaces:
+            self.used_bytes -= self._surface_bytes(self._surfaces.pop(key))
+
+        self._surfaces[key] = surface
+        self.used_bytes += self._surface_bytes(surface)
+
+        # Evict least recently used surfaces, but never the new one
+        while self.used_bytes > self.budget_bytes and len(self._surfaces) > 1:
+            old_key, old_surface = self._surfaces.popitem(last=False)
+            self.used_bytes -= self._surface_bytes(old_surface)
+            self.evictions += 1
+            logger.debug(f"Evicted image {old_key}")
+
+    def contains(self, path, size=None, area=None) -> bool:
+        return self.make_key(path, size, area) in self._surfaces
+
+    def clear(self):
+        self._surfaces.clear()
+        self.used_bytes = 0
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._surfaces),
+            "used_bytes": self.used_bytes,
+            "budget_bytes": self.budget_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    @staticmethod
+    def _surface_bytes(surface: pygame.Surface) -> int:
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
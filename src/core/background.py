@@ -1,8 +1,9 @@
-from pathlib import Path
 from typing import Tuple, Union
 
 import pygame
 
+from core.assets import ImageRegistry, asset_path
+
 
 class Background:
     def __init__(self, color: Union[str | Tuple] = "white", image: str = None):
@@ -23,14 +24,10 @@ class Background:
 
     def render(self, screen: pygame.Surface):
         if self.image:
-            background = pygame.image.load(
-                Path().parent / "assets" / "backgrounds" / self.image
-            )
-            screen.blit(
-                pygame.transform.scale(
-                    background, (screen.get_width(), screen.get_height())
-                ),
-                (0, 0),
+            # Decoded and scaled once, then served from the shared registry
+            background = ImageRegistry.get_instance().load(
+                asset_path("backgrounds", self.image), screen.get_size()
             )
+            screen.blit(background, (0, 0))
         else:
             screen.fill(pygame.Color(self.color))
@@ -0,0 +1,181 @@
+import argparse
+import hashlib
+import json
+import mmap
+import struct
+
+import pygame
+
+from core.assets import ASSETS_DIR, ImageRegistry
+from core.logs import get_logger
+
+logger = get_logger("AssetBundle")
+
+BUNDLE_PATH = ASSETS_DIR / "assets.bundle"
+
+MAGIC = b"BFSB"
+VERSION = 1
+
+# Magic, format version and index length
+HEADER = struct.Struct("<4sII")
+
+# Pixel data offsets are aligned for fast copies
+ALIGNMENT = 64
+
+# Byte order of convert_alpha() surfaces on little-endian displays
+PIXEL_FORMAT = "BGRA"
+
+
+def _align(offset: int) -> int:
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def _relative(path) -> str:
+    return path.relative_to(ASSETS_DIR).as_posix()
+
+
+def _source_hashes(manifest) -> dict:
+    hashes = {}
+    for path, _ in manifest:
+        with open(path, "rb") as source:
+            hashes[_relative(path)] = hashlib.sha256(source.read()).hexdigest()
+    return hashes
+
+
+def _read_index(path=BUNDLE_PATH):
+    """Read the index of an existing bundle, or None if it is unusable."""
+    try:
+        with open(path, "rb") as bundle_file:
+            magic, version, index_length = HEADER.unpack(bundle_file.read(HEADER.size))
+            if magic != MAGIC or version != VERSION:
+                return None
+            return json.loads(bundle_file.read(index_length))
+    except (OSError, ValueError, struct.error):
+        return None
+
+
+def is_current(screen_size: tuple[int, int], path=BUNDLE_PATH) -> bool:
+    """Check a bundle against the current assets and scaling settings."""
+    from core.preload import build_manifest, manifest_settings
+
+    index = _read_index(path)
+    if index is None or index["settings"] != manifest_settings(screen_size):
+        return False
+    return index["sources"] == _source_hashes(build_manifest(screen_size))
+
+
+def build(screen_size: tuple[int, int], path=BUNDLE_PATH, force: bool = False):
+    """Write the bundle, unless its source hashes are already up to date."""
+    from core.preload import build_manifest, manifest_settings, prepare_image
+
+    if not force and is_current(screen_size, path):
+        logger.info(f"Asset bundle '{path}' is up to date")
+        return False
+
+    manifest = build_manifest(screen_size)
+    entries = []
+    blobs = []
+    data_size = 0
+    for source, variants in manifest:
+        for size, area, pixel_size, pixels in prepare_image(source, variants):
+            # Reorder channels once here instead of converting at runtime
+            surface = pygame.image.frombuffer(pixels, pixel_size, "RGBA")
+            pixels = pygame.image.tobytes(surface, PIXEL_FORMAT)
+
+            data_size = _align(data_size)
+            entries.append(
+                {
+                    "path": _relative(source),
+                    "size": list(size) if size else None,
+                    "area": list(area) if area else None,
+                    "pixel_size": list(pixel_size),
+                    "offset": data_size,
+                    "length": len(pixels),
+                }
+            )
+            blobs.append((data_size, pixels))
+            data_size += len(pixels)
+
+    index = json.dumps(
+        {
+            "format": PIXEL_FORMAT,
+            "settings": manifest_settings(screen_size),
+            "sources": _source_hashes(manifest),
+            "entries": entries,
+        }
+    ).encode()
+
+    # Offsets in the index are relative to the aligned start of pixel data
+    data_start = _align(HEADER.size + len(index))
+    with open(path, "wb") as bundle_file:
+        bundle_file.write(HEADER.pack(MAGIC, VERSION, len(index)))
+        bundle_file.write(index)
+        for offset, pixels in blobs:
+            bundle_file.seek(data_start + offset)
+            bundle_file.write(pixels)
+
+    logger.info(
+        f"Wrote asset bundle '{path}' with {len(entries)} surfaces "
+        f"({(data_start + data_size) // 1024} KiB)"
+    )
+    return True
+
+
+class AssetBundle:
+    """Memory-mapped view of a built asset bundle.
+
+    The bundle holds every variant from the preload manifest already cropped,
+    scaled and stored as raw pixels in the display's BGRA layout, behind a
+    JSON index of offsets. Surfaces are created straight from views of the
+    mapping, so a cold start does no decoding and no scaling.
+    """
+
+    def __init__(self, path=BUNDLE_PATH):
+        self.path = path
+        with open(path, "rb") as bundle_file:
+            # Copy-on-write keeps surfaces writable without touching the file
+            self._mmap = mmap.mmap(bundle_file.fileno(), 0, access=mmap.ACCESS_COPY)
+
+        magic, version, index_length = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"'{path}' is not a version {VERSION} asset bundle")
+
+        self.index = json.loads(self._mmap[HEADER.size : HEADER.size + index_length])
+        self._data_start = _align(HEADER.size + index_length)
+        self._view = memoryview(self._mmap)
+
+    def surfaces(self):
+        """Yield `(path, size, area, surface)` for every bundled surface."""
+        pixel_format = self.index["format"]
+        for entry in self.index["entries"]:
+            start = self._data_start + entry["offset"]
+            surface = pygame.image.frombuffer(
+                self._view[start : start + entry["length"]],
+                tuple(entry["pixel_size"]),
+                pixel_format,
+            )
+            yield ASSETS_DIR / entry["path"], entry["size"], entry["area"], surface
+
+    def install(self, registry: ImageRegistry = None) -> int:
+        """Register every bundled surface, returning how many were added."""
+        registry = registry or ImageRegistry.get_instance()
+        count = 0
+        for path, size, area, surface in self.surfaces():
+            registry.put(registry.make_key(path, size, area), surface)
+            count += 1
+        logger.info(f"Installed {count} surfaces from asset bundle '{self.path}'")
+        return count
+
+
+# Run from src/: python -m core.bundle --width 1366 --height 768
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the precompiled asset bundle")
+    parser.add_argument("--width", type=int, default=1366)
+    parser.add_argument("--height", type=int, default=768)
+    parser.add_argument("--output", default=BUNDLE_PATH)
+    parser.add_argument(
+        "--force", action="store_true", help="rebuild even if up to date"
+    )
+    args = parser.parse_args()
+
+    build((args.width, args.height), args.output, force=args.force)
@@ -0,0 +1,90 @@
+import weakref
+
+import pygame
+
+from core.logs import get_logger
+
+logger = get_logger("Collision")
+
+
+class MaskCache:
+    """Collision masks of textures and animation frames.
+
+    A mask is built once per surface, when the texture is loaded, and is
+    dropped together with the surface.
+    """
+
+    _instance = None
+
+    @classmethod
+    def get_instance(cls):
+        """Singleton pattern to share one cache across all states"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        # Surface -> (mask, bounding rect of its opaque pixels)
+        self._entries = weakref.WeakKeyDictionary()
+
+    def _entry(self, surface: pygame.Surface) -> tuple:
+        entry = self._entries.get(surface)
+        if entry is None:
+            mask = pygame.mask.from_surface(surface)
+            bounds = mask.get_bounding_rects()
+            entry = (
+                mask,
+                bounds[0].unionall(bounds[1:]) if bounds else pygame.Rect(0, 0, 0, 0),
+            )
+            self._entries[surface] = entry
+        return entry
+
+    def build(self, surfaces):
+        """Build the masks of surfaces ahead of their first collision test."""
+        for surface in surfaces:
+            self._entry(surface)
+
+    def mask(self, surface: pygame.Surface) -> pygame.mask.Mask:
+        return self._entry(surface)[0]
+
+    def bounds(self, surface: pygame.Surface) -> pygame.Rect:
+        """Bounding rectangle of the surface's opaque pixels."""
+        return self._entry(surface)[1]
+
+
+def masks_overlap(mask, position, other_mask, other_position) -> bool:
+    """Whether two masks placed at their top-left positions share a pixel."""
+    offset = (other_position[0] - position[0], other_position[1] - position[1])
+    return mask.overlap(other_mask, offset) is not None
+
+
+def sweep(start, end, other_start, other_end):
+    """When two rectangles moving over a step overlap during it.
+
+    Each rectangle keeps its size and moves in a straight line from its
+    start to its end position. Returns the fractions of the step `(entry,
+    exit)` between which they overlap, clamped to the step, or None when
+    they do not overlap during it. `entry` is the time of impact.
+    """
+    entry, exit = 0.0, 1.0
+    for axis in (0, 1):
+        # Position and motion of `start` relative to `other_start`
+        position = start[axis] - other_start[axis]
+        motion = (end[axis] - start[axis]) - (other_end[axis] - other_start[axis])
+        size, other_size = start[axis + 2], other_start[axis + 2]
+
+        # The rectangles overlap on this axis while
+        # -size < position + motion * t < other_size
+        if motion == 0:
+            if not -size < position < other_size:
+                return None
+            continue
+        first = (-size - position) / motion
+        last = (other_size - position) / motion
+        if first > last:
+            first, last = last, first
+        entry = max(entry, first)
+        exit = min(exit, last)
+        if entry >= exit:
+            return None
+    return entry, exit
@@ -0,0 +1,224 @@
+import time
+
+import pygame
+
+from core.logs import get_logger
+
+logger = get_logger("DirtyRenderer")
+
+RENDER_MODES = ("full", "dirty")
+
+# Draw order of the sprite layers
+PLAYER_LAYER = 1
+OBSTACLE_LAYER = 2
+HUD_LAYER = 3
+
+
+class RenderStats:
+    """Frame time and fill rate of one render mode."""
+
+    def __init__(self, mode: str):
+        self.mode = mode
+        self.frames = 0
+        self.full_frames = 0
+        self.pixels = 0
+        self.render_ms = 0.0
+
+    def record(self, render_ms: float, pixels: int, full: bool):
+        self.frames += 1
+        self.full_frames += full
+        self.pixels += pixels
+        self.render_ms += render_ms
+
+    def summary(self) -> str:
+        frames = max(self.frames, 1)
+        summary = (
+            f"{self.mode} rendering: {self.frames} frames, "
+            f"{self.render_ms / frames:.2f} ms/frame, "
+            f"{self.pixels / frames / 1000:.0f}k pixels presented/frame, "
+            f"{self.full_frames} full-screen presents"
+        )
+        if self.mode == "dirty" and self.full_frames == self.frames:
+            # The background scrolled on every frame
+            summary += " (no savings over full rendering)"
+        return summary
+
+
+class PlayerSprite(pygame.sprite.DirtySprite):
+    def __init__(self, player):
+        super().__init__()
+        self.player = player
+        self.image = None
+        self.rect = pygame.Rect(0, 0, 0, 0)
+
+    def update(self):
+        player = self.player
+        image = player.current_image()
+        if image is None:
+            # Fallback player sprite
+            if self.image is None or self.image.get_size() != player.rect.size:
+                self.image = pygame.Surface(player.rect.size)
+                self.image.fill((255, 0, 255))
+                self.dirty = 1
+            position = player.rect.topleft
+        else:
+            if image is not self.image:
+                self.image = image
+                self.dirty = 1
+            position = player.sprite_position()
+
+        if self.rect.topleft != position or self.rect.size != self.image.get_size():
+            self.rect = pygame.Rect(position, self.image.get_size())
+            self.dirty = 1
+
+
+class ObstacleSprite(pygame.sprite.DirtySprite):
+    def __init__(self, obstacle):
+        super().__init__()
+        self.obstacle = obstacle
+        self.image = obstacle.texture
+        self.rect = pygame.Rect(obstacle.x, obstacle.y, *obstacle.texture.get_size())
+
+    def update(self):
+        obstacle = self.obstacle
+        if self.image is not obstacle.texture:
+            # Pooled obstacles are reused with another texture
+            self.image = obstacle.texture
+            self.rect = pygame.Rect(obstacle.x, obstacle.y, *self.image.get_size())
+            self.dirty = 1
+            return
+        position = (obstacle.x, obstacle.y)
+        if self.rect.topleft != position:
+            self.rect.topleft = position
+            self.dirty = 1
+
+
+class HudSprite(pygame.sprite.DirtySprite):
+    """HUD text that is only redrawn when its string changes."""
+
+    def __init__(self, text_source, render_text, position):
+        super().__init__()
+        self.text_source = text_source
+        self.render_text = render_text
+        self.position = position
+        self.text = None
+        self.image = pygame.Surface((0, 0))
+        self.rect = pygame.Rect(position, (0, 0))
+
+    def update(self):
+        text = self.text_source()
+        if text == self.text:
+            return
+        self.text = text
+        self.visible = 1 if text else 0
+        if text:
+            self.image = self.render_text(text)
+            self.rect = pygame.Rect(self.position, self.image.get_size())
+        self.dirty = 1
+
+
+class DirtyRenderer:
+    """Dirty-rectangle renderer for PlayState.
+
+    The player, obstacles and HUD are dirty sprites in a LayeredDirty group,
+    and only the regions they changed are presented with
+    `display.update(rects)`. That only pays off while the background is
+    still: the background layer covers the screen, so whenever the scroller
+    moves, which is every step of normal play, every pixel changes and the
+    frame is handed to the full renderer instead. Debug hitboxes are only
+    drawn by the full renderer.
+    """
+
+    def __init__(self, play_state):
+        self.play_state = play_state
+        self.game = play_state.game
+        self.background = pygame.Surface(self.game.screen.get_size()).convert()
+        self._background_state = None
+        self._stale = True
+        self._obstacle_sprites = {}
+
+        self.group = pygame.sprite.LayeredDirty()
+        self.group.clear(self.game.screen, self.background)
+        self.group.add(PlayerSprite(play_state.player), layer=PLAYER_LAYER)
+
+        atlas = play_state.score_atlas
+        for text_source, position in (
+            (lambda: f"Score: {play_state.score:03}", play_state.score_position),
+            (
+                lambda: (
+                    f"High Score: {self.game.high_score:03}"
+                    if self.game.high_score > 0
+                    else ""
+                ),
+                play_state.high_score_position,
+            ),
+        ):
+            self.group.add(
+                HudSprite(text_source, self._atlas_text(atlas), position),
+                layer=HUD_LAYER,
+            )
+
+        pause_text = play_state.pause_text
+        self.group.add(
+            HudSprite(
+                lambda: pause_text.text, pause_text.font.render, pause_text.position
+            ),
+            layer=HUD_LAYER,
+        )
+
+    @staticmethod
+    def _atlas_text(atlas):
+        def render_text(text):
+            surface = pygame.Surface(atlas.measure(text), pygame.SRCALPHA)
+            atlas.draw(surface, text, (0, 0))
+            return surface
+
+        return render_text
+
+    def _sync_obstacles(self):
+        obstacles = self.play_state.obstacle_manager.obstacles
+        sprites = self._obstacle_sprites
+
+        current = set(map(id, obstacles))
+        for key in [key for key in sprites if key not in current]:
+            sprites.pop(key).kill()
+
+        for obstacle in obstacles:
+            if id(obstacle) not in sprites and obstacle.texture is not None:
+                sprite = ObstacleSprite(obstacle)
+                sprites[id(obstacle)] = sprite
+                self.group.add(sprite, layer=OBSTACLE_LAYER)
+
+    def render(self) -> tuple[int, bool]:
+        """Draw a frame, returning the presented pixel count and whether it was full."""
+        scroll_state = self.play_state.scroller.visible_state()
+        if scroll_state != self._background_state:
+            # The scrolling layers dirtied the whole screen, so the sprites
+            # are not tracked until the background is still again
+            self._background_state = scroll_state
+            self._stale = True
+            return self.play_state._render_full()
+
+        screen = self.game.screen
+        self._sync_obstacles()
+        self.group.update()
+
+        if self._stale:
+            # Repaint everything the full renderer drew over
+            self._stale = False
+            self.play_state.scroller.draw(self.background)
+            self.group.repaint_rect(screen.get_rect())
+            self.group.draw(screen)
+            self.game.present()
+            return screen.get_width() * screen.get_height(), True
+
+        rects = self.group.draw(screen)
+        self.game.present(rects)
+        return sum(rect.width * rect.height for rect in rects), False
+
+
+def timed_render(stats: RenderStats, render):
+    """Run a render function and record its timing in `stats`."""
+    start = time.perf_counter()
+    pixels, full = render()
+    stats.record((time.perf_counter() - start) * 1000, pixels, full)
@@ -1,5 +1,62 @@
 import pygame
-from pathlib import Path
+from collections import OrderedDict
+
+from core.assets import asset_path
+
+# Maximum number of finished text surfaces kept in memory
+TEXT_CACHE_SIZE = 256
+
+# Loaded font faces, keyed by (font file, size)
+_faces = {}
+
+
+def get_face(font_name: str, size: int) -> pygame.font.Font:
+    """Return the shared font face for a font file and size."""
+    key = (font_name, size)
+    face = _faces.get(key)
+    if face is None:
+        face = pygame.font.Font(asset_path("fonts", font_name), size)
+        _faces[key] = face
+    return face
+
+
+class TextCache:
+    """Bounded LRU cache of rendered text surfaces."""
+
+    def __init__(self, max_entries: int = TEXT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._surfaces = OrderedDict()
+
+    def get(self, key: tuple):
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+        else:
+            self.misses += 1
+        return surface
+
+    def put(self, key: tuple, surface: pygame.Surface):
+        self._surfaces[key] = surface
+        self._surfaces.move_to_end(key)
+        while len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+
+    def clear(self):
+        self._surfaces.clear()
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._surfaces),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+text_cache = TextCache()
 
 
 class Font:
@@ -22,32 +79,70 @@ class Font:
         self.shadow_offset = shadow_offset
         self.shadow_color = shadow_color
 
-        # Load the font
-        self.font = pygame.font.Font(
-            Path(__file__).parent.parent.parent / f"assets/fonts/{font_name}", size
-        )
+        # Load the font (shared between all Font objects of the same face)
+        self.font = get_face(font_name, size)
 
         self.color = color
         self.antialiased = antialiased
 
+    @property
+    def style(self) -> tuple:
+        """Everything besides the text that affects the rendered pixels."""
+        return (
+            self.font_name,
+            self.size,
+            self.color,
+            self.antialiased,
+            self.shadow,
+            self.shadow_offset,
+            self.shadow_color,
+        )
+
+    def with_color(self, color: tuple[int, int, int]) -> "Font":
+        """Return a copy of this font drawing in another color."""
+        return Font(
+            self.font_name,
+            self.size,
+            color,
+            antialiased=self.antialiased,
+            shadow=self.shadow,
+            shadow_offset=self.shadow_offset,
+            shadow_color=self.shadow_color,
+        )
+
     def render(self, text: str) -> pygame.Surface:
-        # Render the drop shadow if enabled
-        if self.shadow:
-            shadow_surface = self.font.render(text, self.antialiased, self.shadow_color)
-            shadow_width, shadow_height = shadow_surface.get_size()
-            surface = pygame.Surface(
-                (
-                    shadow_width + abs(self.shadow_offset[0]),
-                    shadow_height + abs(self.shadow_offset[1]),
-                ),
-                pygame.SRCALPHA,
-            )
-            surface.blit(shadow_surface, self.shadow_offset)
-        else:
-            surface = pygame.Surface((0, 0), pygame.SRCALPHA)
+        """Render text, reusing a cached surface when possible.
+
+        The returned surface is shared and must not be drawn onto.
+        """
+        key = (text, self.style)
+        surface = text_cache.get(key)
+        if surface is None:
+            surface = self._render(text)
+            text_cache.put(key, surface)
+        return surface
 
+    def measure(self, text: str) -> tuple[int, int]:
+        """Size of the rendered text, including its drop shadow."""
+        return self.render(text).get_size()
+
+    def _render(self, text: str) -> pygame.Surface:
         # Render the main text
         text_surface = self.font.render(text, self.antialiased, self.color)
+        if not self.shadow:
+            return text_surface
+
+        # Render the drop shadow
+        shadow_surface = self.font.render(text, self.antialiased, self.shadow_color)
+        shadow_width, shadow_height = shadow_surface.get_size()
+        surface = pygame.Surface(
+            (
+                shadow_width + abs(self.shadow_offset[0]),
+                shadow_height + abs(self.shadow_offset[1]),
+            ),
+            pygame.SRCALPHA,
+        )
+        surface.blit(shadow_surface, self.shadow_offset)
         surface.blit(text_surface, (0, 0))
 
         return surface
@@ -0,0 +1,128 @@
+import time
+
+import pygame
+
+from core.logs import get_logger
+
+logger = get_logger("FramePacing")
+
+# Frame policies states choose from with their FRAME_POLICY attribute
+IDLE = "idle"  # static screens, sleep until an event arrives
+LOW = "low"  # screens without motion that should stay responsive
+PLAY = "play"  # gameplay, evenly paced frames at the full frame rate
+FRAME_POLICIES = (IDLE, LOW, PLAY)
+
+# Idle screens still wake up this often, e.g. for the startup report
+IDLE_TIMEOUT_MS = 500
+# and check for input this often while they wait
+IDLE_POLL_SECONDS = 0.01
+LOW_FPS = 20
+
+# The end of a precise frame is spun on instead of slept, as sleeping
+# can overshoot by about this much
+SPIN_SECONDS = 0.002
+
+# Weight of the newest frame in the smoothed frame time
+SMOOTHING = 0.1
+
+
+class FrameStats:
+    """Frame time statistics of one frame policy."""
+
+    def __init__(self, policy: str):
+        self.policy = policy
+        self.frames = 0
+        self.total_ms = 0.0
+        self.smoothed_ms = None
+        self.worst_ms = 0.0
+
+    def record(self, frame_ms: float):
+        self.frames += 1
+        self.total_ms += frame_ms
+        self.worst_ms = max(self.worst_ms, frame_ms)
+        if self.smoothed_ms is None:
+            self.smoothed_ms = frame_ms
+        else:
+            self.smoothed_ms += (frame_ms - self.smoothed_ms) * SMOOTHING
+
+    def summary(self) -> str:
+        frames = max(self.frames, 1)
+        return (
+            f"{self.policy} frames: {self.frames}, "
+            f"{self.total_ms / frames:.2f} ms average, "
+            f"{self.smoothed_ms or 0:.2f} ms smoothed, {self.worst_ms:.2f} ms worst"
+        )
+
+
+class FramePacer:
+    """Ends each frame the way the current state's frame policy asks for.
+
+    Idle screens sleep until there is input, only waking up briefly to
+    peek at the event queue, and leave the events in it for the state's own
+    event loop, in the order they arrived. Low screens sleep to a
+    low frame rate cap. Play frames are paced against a fixed schedule of
+    deadlines, sleeping most of the wait and spinning the last moment for
+    precision, or leave the pacing to vsync when the display has it.
+    """
+
+    def __init__(self, max_fps: int, vsync: bool = False):
+        self.max_fps = max_fps
+        self.vsync = vsync
+        self.policy = None
+        self.stats = {policy: FrameStats(policy) for policy in FRAME_POLICIES}
+        self._frame_start = time.perf_counter()
+        self._deadline = self._frame_start
+
+    def end_frame(self, policy: str) -> bool:
+        """Wait until the next frame is due, returning whether the wait was idle."""
+        if policy != self.policy:
+            logger.debug(f"Frame policy {self.policy} -> {policy}")
+            self.policy = policy
+            self._deadline = time.perf_counter()
+
+        idle = False
+        if policy == IDLE:
+            idle = self._wait_for_event()
+        elif policy == LOW:
+            self._sleep_until(self._next_deadline(LOW_FPS), spin=False)
+        elif not self.vsync:
+            self._sleep_until(self._next_deadline(self.max_fps), spin=True)
+
+        now = time.perf_counter()
+        if not idle:
+            self.stats[policy].record((now - self._frame_start) * 1000)
+        self._frame_start = now
+        return idle
+
+    def _next_deadline(self, fps: int) -> float:
+        # Deadlines follow a fixed schedule so frame times do not drift,
+        # after a late frame the schedule restarts instead of catching up
+        self._deadline = max(self._deadline + 1 / fps, time.perf_counter())
+        return self._deadline
+
+    @staticmethod
+    def _sleep_until(deadline: float, spin: bool):
+        remaining = deadline - time.perf_counter()
+        if spin:
+            remaining -= SPIN_SECONDS
+        if remaining > 0:
+            time.sleep(remaining)
+        if spin:
+            while time.perf_counter() < deadline:
+                pass
+
+    @staticmethod
+    def _wait_for_event() -> bool:
+        if pygame.event.peek():
+            return False
+        # Peeking does not take the event off the queue, so events that
+        # arrive together keep their order
+        deadline = time.perf_counter() + IDLE_TIMEOUT_MS / 1000
+        while not pygame.event.peek() and time.perf_counter() < deadline:
+            time.sleep(IDLE_POLL_SECONDS)
+        return True
+
+    def log_stats(self):
+        for stats in self.stats.values():
+            if stats.frames:
+                logger.info(stats.summary())
@@ -1,5 +1,18 @@
+import os
+import random
+import time
+
 import pygame
+from core.allocations import AllocationTracker
+from core.assets import ImageRegistry
+from core.dirty_renderer import RENDER_MODES, RenderStats
+from core.frame_pacing import FramePacer
+from core.game_clock import GameClock
+from core.gc_policy import GCPolicy
 from core.logs import get_logger
+from core.profiler import FrameProfiler
+from core.resolution import AdaptiveResolution, scaled_size
+from core.startup import startup_report
 
 logger = get_logger("Game")
 
@@ -7,7 +20,32 @@ FPS = 120
 
 
 class Game:
-    def __init__(self, width: int = 1280, height: int = 720, title: str = "Game"):
+    def __init__(
+        self,
+        width: int = 1280,
+        height: int = 720,
+        title: str = "Game",
+        preload: bool = True,
+        fast_startup: bool = False,
+        startup_budget_ms: float = None,
+        render_mode: str = "full",
+        render_scale: float = 1.0,
+        adaptive_resolution: bool = False,
+        max_fps: int = FPS,
+        time_scale: float = 1.0,
+        vsync: bool = False,
+        headless: bool = False,
+        seed: int = None,
+        profile: bool = False,
+        profile_details: bool = False,
+        profile_trace: str = None,
+        track_allocations: bool = False,
+        gc_policy: bool = True,
+        obstacle_backend: str = "objects",
+    ):
+        self.metrics = {}
+        self.startup_budget_ms = startup_budget_ms
+
         self.width = width
         self.height = height
         self.title = title
@@ -15,38 +53,272 @@ class Game:
         self.sound_port = "COM11"
         self.sound_baudrate = 115200
 
+        # Headless games run on SDL's dummy drivers without presenting, and
+        # advance game time by exactly one step per frame, as fast as they can
+        self.headless = headless
+        if headless:
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
+            adaptive_resolution = False
+
+        # "objects" keeps one object per obstacle, "batch" keeps them in NumPy
+        # arrays for dense obstacle fields
+        self.obstacle_backend = obstacle_backend
+
+        # Gameplay randomness, the same seed and input replay the same game
+        self.seed = seed
+        self.rng = random.Random(seed)
+
+        # Gameplay runs on virtual time in fixed steps, independent of the
+        # render frame rate, which is capped at max_fps
+        self.game_clock = GameClock(time_scale=time_scale)
+        self.max_fps = max_fps
+
+        # Each state's FRAME_POLICY decides how its frames are paced
+        self.frame_pacer = FramePacer(max_fps, vsync)
+
+        # Times the phases of each frame. F3 shows the overlay and F4 exports
+        # a trace during play, profile_trace exports one when the game ends.
+        self.profiler = FrameProfiler(
+            1000 / max_fps,
+            enabled=profile or bool(profile_trace),
+            details=profile_details,
+        )
+        self.profile_trace = profile_trace
+
+        # Keeps garbage collection out of gameplay frames
+        self.gc_policy = GCPolicy(gc_policy)
+
+        # Counts each frame's allocations, reported when the game ends
+        self.allocation_tracker = AllocationTracker() if track_allocations else None
+
+        # PlayState rendering, F2 switches modes to compare their stats
+        self.render_mode = render_mode
+        self.render_stats = {mode: RenderStats(mode) for mode in RENDER_MODES}
+
+        # States with SCALES_RESOLUTION render at a logical resolution of
+        # render_scale times the window size, upscaled when presented
+        self.render_scale = render_scale
+        self.adaptive_resolution = (
+            AdaptiveResolution(1000 / max_fps, start=render_scale)
+            if adaptive_resolution
+            else None
+        )
+        self.display_scale = None
+        self.window = None
+        # Offscreen surfaces of scaled states, by render scale
+        self._scaled_screens = {}
+
         # Initialize pygame
-        pygame.init()
+        with startup_report.phase("pygame init"):
+            self._init_pygame(fast_startup)
 
         logger.info(f"Initializing game: {title} ({width}x{height})")
 
-        self.screen = pygame.display.set_mode((self.width, self.height))
-        pygame.display.set_caption(self.title)
-
-        self.clock = pygame.time.Clock()
+        with startup_report.phase("display"):
+            self._open_window()
+            self._configure_display(1.0)
+            pygame.display.set_caption(self.title)
 
         self.running = True
 
-        from core.state.menu_state import MenuState
+        if preload:
+            with startup_report.phase("assets"):
+                self._load_assets()
+            self.metrics["preload_ms"] = startup_report.phase_ms("assets")
+
+        with startup_report.phase("initial state"):
+            from core.state.menu_state import MenuState
 
-        self.state = MenuState(self)
+            self.state = MenuState(self)
+
+        with startup_report.phase("gc freeze"):
+            # Everything alive by now stays alive until the game ends
+            self.gc_policy.freeze()
+            self.gc_policy.enter_state(self.state)
         logger.info("Game initialized")
 
+    @staticmethod
+    def _init_pygame(fast_startup: bool):
+        if not fast_startup:
+            pygame.init()
+            return
+
+        # Only start the subsystems the game uses, mixer and joystick stay off
+        pygame.display.init()
+        pygame.font.init()
+
+    def _load_assets(self):
+        """Fill the image registry before the first state is built."""
+        from core import bundle
+
+        screen_size = (self.width, self.height)
+        if bundle.is_current(screen_size):
+            # Pre-scaled pixels are memory-mapped, nothing to decode
+            bundle.AssetBundle().install()
+            return
+
+        logger.warning(
+            "Asset bundle is missing or out of date, decoding assets instead. "
+            "Run `python -m core.bundle` from src/ to build it."
+        )
+        from core.preload import Preloader
+
+        # Decode every asset up front behind a loading screen
+        Preloader(self).run()
+
+    def _open_window(self):
+        """Open the window at the design size, once for the whole game."""
+        size = (self.width, self.height)
+        if self.frame_pacer.vsync:
+            # pygame only honors vsync on SCALED displays. Its logical size is
+            # the window size, so nothing is rescaled.
+            try:
+                self.window = pygame.display.set_mode(size, pygame.SCALED, vsync=1)
+                return
+            except pygame.error as e:
+                logger.warning(f"vsync unavailable ({e}), pacing frames instead")
+                self.frame_pacer.vsync = False
+        self.window = pygame.display.set_mode(size)
+
+    def _configure_display(self, scale: float):
+        """Point `self.screen`, the surface states draw into, at a render scale.
+
+        Below scale 1.0, states draw into an offscreen surface, which is
+        upscaled to the window when presenting.
+        """
+        if scale == self.display_scale:
+            return
+        self.display_scale = scale
+        if scale == 1.0:
+            self.screen = self.window
+            return
+
+        screen = self._scaled_screens.get(scale)
+        if screen is None:
+            size = scaled_size((self.width, self.height), scale)
+            screen = self._scaled_screens[scale] = pygame.Surface(size).convert()
+        self.screen = screen
+
+    def _state_scale(self) -> float:
+        return self.render_scale if self.state.SCALES_RESOLUTION else 1.0
+
     def set_state(self, new_state):
         """Switch to a new state."""
         logger.debug(f"Switching state to {new_state.__class__.__name__}")
         self.state = new_state
+        self._configure_display(self._state_scale())
+        self.gc_policy.enter_state(new_state)
+
+    def set_render_scale(self, scale: float):
+        """Change the logical resolution of states that scale it."""
+        self.render_scale = scale
+        self._configure_display(self._state_scale())
 
-    def run(self):
-        """Main game loop."""
+    def toggle_render_mode(self):
+        logger.info(self.render_stats[self.render_mode].summary())
+        self.render_mode = RENDER_MODES[
+            (RENDER_MODES.index(self.render_mode) + 1) % len(RENDER_MODES)
+        ]
+        logger.info(f"Switched to {self.render_mode} rendering")
+
+    def present(self, rects=None):
+        """Show the frame, or only the given dirty rectangles of it."""
+        if self.headless:
+            return
+        with self.profiler.scope("present"):
+            self._present(rects)
+
+    def _present(self, rects):
+        if self.screen is not self.window:
+            pygame.transform.scale(self.screen, self.window.get_size(), self.window)
+            rects = None
+        if self.profiler.overlay:
+            # Drawn over the final frame, after any upscaling
+            overlay_rect = self.profiler.draw_overlay(self.window)
+            if rects is not None:
+                rects = [*rects, overlay_rect]
+        if rects is None:
+            pygame.display.flip()
+        elif rects:
+            pygame.display.update(rects)
+
+    def run(self, max_frames: int = None):
+        """Main game loop, optionally ending after `max_frames` frames."""
         logger.info("Starting game loop")
-        while self.running:
+        if self.allocation_tracker:
+            self.allocation_tracker.start()
+        frames = 0
+        previous_frame = time.perf_counter()
+        while self.running and frames != max_frames:
+            frame_start = time.perf_counter()
+            elapsed_ms = (frame_start - previous_frame) * 1000
+            previous_frame = frame_start
+            frames += 1
+
+            if self.headless:
+                elapsed_ms = self.game_clock.step_ms
+            self._frame(elapsed_ms)
+
+            if self.adaptive_resolution and self.state.SCALES_RESOLUTION:
+                scale = self.adaptive_resolution.record(
+                    (time.perf_counter() - frame_start) * 1000
+                )
+                if scale is not None:
+                    self.set_render_scale(scale)
+
+            if "time_to_first_frame_ms" not in self.metrics:
+                self.metrics["time_to_first_frame_ms"] = startup_report.elapsed_ms()
+                startup_report.finish(self.startup_budget_ms)
+
+            if self.headless:
+                continue
+            if self.frame_pacer.end_frame(self.state.FRAME_POLICY):
+                # Time spent waiting for input on idle screens is not game time
+                previous_frame = time.perf_counter()
+        logger.info(f"Game loop ended after {frames} frames")
+        logger.info(f"Image registry stats: {ImageRegistry.get_instance().stats()}")
+        for stats in self.render_stats.values():
+            if stats.frames:
+                logger.info(stats.summary())
+        self.frame_pacer.log_stats()
+        self.gc_policy.log_stats()
+        self.gc_policy.close()
+        if self.profiler.frames:
+            logger.info(self.profiler.summary())
+        if self.profile_trace:
+            self.profiler.export_chrome_trace(self.profile_trace)
+        if self.allocation_tracker:
+            self.allocation_tracker.stop()
+            logger.info(self.allocation_tracker.report())
+
+    def _frame(self, elapsed_ms: float, render: bool = True):
+        profiler = self.profiler
+        tracker = self.allocation_tracker
+        if tracker:
+            tracker.begin_frame(self.state.__class__.__name__)
+        profiler.begin_frame()
+        with profiler.scope("handle_events"):
             self.handle_events()
-            self.state.update()
-            self.state.render()
+        with profiler.scope("update"):
+            for _ in self.game_clock.steps(elapsed_ms):
+                self.state.update()
+        if render:
+            with profiler.scope("render"):
+                self.state.render()
+        profiler.end_frame()
+        if tracker:
+            tracker.end_frame()
+
+    def step_frame(self, events=(), render: bool = True):
+        """Run one frame of one simulation step, after posting `events`.
 
-            self.clock.tick(FPS)
-        logger.info("Game loop ended")
+        Meant for headless games driven by tests, benchmarks and bots, which
+        can skip rendering frames they do not look at.
+        """
+        for event in events:
+            pygame.event.post(event)
+        self._frame(self.game_clock.step_ms, render)
 
     def handle_events(self):
         """Delegate event handling to the current state."""
@@ -0,0 +1,42 @@
+# Simulation steps per second. Movement constants are per step and were
+# tuned at 120 frames per second, so the game plays the same at any FPS.
+UPDATE_RATE = 120
+
+# Longer frames are clamped so a stall does not trigger a burst of steps
+MAX_FRAME_MS = 250
+
+
+class GameClock:
+    """Virtual game time that drives the fixed-timestep simulation.
+
+    Real frame time is converted into whole simulation steps of `step_ms`.
+    Game time only advances with those steps, so it stands still while the
+    clock is paused and runs slower or faster with `time_scale`. The part
+    of a step left over is exposed as `alpha`, for interpolating rendered
+    positions between the last two steps.
+    """
+
+    def __init__(self, update_rate: int = UPDATE_RATE, time_scale: float = 1.0):
+        self.step_ms = 1000 / update_rate
+        self.time_scale = time_scale
+        self.paused = False
+        self._accumulator = 0.0
+
+    @property
+    def alpha(self) -> float:
+        return self._accumulator / self.step_ms
+
+    def pause(self):
+        self.paused = True
+
+    def resume(self):
+        self.paused = False
+
+    def steps(self, real_ms: float):
+        """Yield once per simulation step covered by `real_ms` of real time."""
+        if self.paused:
+            return
+        self._accumulator += min(real_ms, MAX_FRAME_MS) * self.time_scale
+        while self._accumulator >= self.step_ms and not self.paused:
+            self._accumulator -= self.step_ms
+            yield
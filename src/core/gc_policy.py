@@ -0,0 +1,135 @@
+import gc
+import time
+
+from core.logs import get_logger
+
+logger = get_logger("GCPolicy")
+
+# Thresholds while a state defers collections. Generation 0 keeps CPython's
+# default, so short-lived cycles are still freed in small steps, but it
+# never escalates to the older generations, whose collections take longer.
+DEFERRED_THRESHOLDS = (700, 1_000_000, 1_000_000)
+
+
+class GCStats:
+    """Garbage collections during the frames of one state."""
+
+    def __init__(self, state: str):
+        self.state = state
+        self.collections = [0, 0, 0]
+        self.pause_ms = 0.0
+        self.worst_pause_ms = 0.0
+        self.scheduled = 0
+        self.scheduled_ms = 0.0
+
+    def record(self, generation: int, pause_ms: float):
+        self.collections[generation] += 1
+        self.pause_ms += pause_ms
+        self.worst_pause_ms = max(self.worst_pause_ms, pause_ms)
+
+    def summary(self) -> str:
+        gen0, gen1, gen2 = self.collections
+        return (
+            f"{self.state}: {sum(self.collections)} collections "
+            f"(gen0 {gen0}, gen1 {gen1}, gen2 {gen2}), {self.pause_ms:.2f} ms "
+            f"paused, {self.worst_pause_ms:.2f} ms worst, {self.scheduled} "
+            f"scheduled at transitions taking {self.scheduled_ms:.2f} ms"
+        )
+
+
+class GCPolicy:
+    """Schedules garbage collection around gameplay.
+
+    After startup, the objects that live for the whole game are frozen out
+    of the collector's view, so full collections do not have to traverse
+    them. States with DEFERS_GC, i.e. gameplay, raise the thresholds of the
+    older generations so their collections do not hitch frames. Instead,
+    entering any other state, e.g. a menu or game over, runs a full
+    collection, where a hitch is hidden by the screen changing anyway. The
+    collections during each state are counted and timed, whether the policy
+    is enabled or not.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.stats = {}
+        self._state_stats = None
+        self._default_thresholds = gc.get_threshold()
+        self._deferring = False
+        self._frozen = False
+        self._scheduled = False
+        self._gc_start = None
+        gc.callbacks.append(self._on_gc)
+
+    def freeze(self):
+        """Move everything alive after startup to the permanent generation."""
+        if not self.enabled:
+            return
+        start = time.perf_counter()
+        gc.collect()
+        gc.freeze()
+        self._frozen = True
+        logger.info(
+            f"Froze {gc.get_freeze_count()} objects in "
+            f"{(time.perf_counter() - start) * 1000:.2f} ms"
+        )
+
+    def enter_state(self, state):
+        name = state.__class__.__name__
+        stats = self.stats.get(name)
+        if stats is None:
+            stats = self.stats[name] = GCStats(name)
+        self._state_stats = stats
+        if not self.enabled:
+            return
+
+        if state.DEFERS_GC:
+            # Collecting here would delay the first frame of play, so the
+            # garbage waits for the next state that does not defer
+            if not self._deferring:
+                gc.set_threshold(*DEFERRED_THRESHOLDS)
+                self._deferring = True
+            return
+
+        if self._deferring:
+            gc.set_threshold(*self._default_thresholds)
+            self._deferring = False
+        self.collect()
+
+    def collect(self):
+        """Run a full collection, counted as scheduled rather than as a pause."""
+        self._scheduled = True
+        start = time.perf_counter()
+        try:
+            gc.collect()
+        finally:
+            self._scheduled = False
+        if self._state_stats is not None:
+            self._state_stats.scheduled += 1
+            self._state_stats.scheduled_ms += (time.perf_counter() - start) * 1000
+
+    def _on_gc(self, phase: str, info: dict):
+        if self._scheduled or self._state_stats is None:
+            return
+        if phase == "start":
+            self._gc_start = time.perf_counter()
+        elif self._gc_start is not None:
+            pause_ms = (time.perf_counter() - self._gc_start) * 1000
+            self._state_stats.record(info["generation"], pause_ms)
+            self._gc_start = None
+
+    def close(self):
+        """Stop counting collections and undo the policy's changes to gc."""
+        if self._on_gc in gc.callbacks:
+            gc.callbacks.remove(self._on_gc)
+        if self._deferring:
+            gc.set_threshold(*self._default_thresholds)
+            self._deferring = False
+        if self._frozen:
+            # Lets the collector free what the game kept alive
+            gc.unfreeze()
+            self._frozen = False
+
+    def log_stats(self):
+        for stats in self.stats.values():
+            logger.info(stats.summary())
@@ -0,0 +1,156 @@
+import pygame
+
+from core.font import Font
+from core.logs import get_logger
+
+logger = get_logger("GlyphAtlas")
+
+# Characters rasterized up front for HUD counters
+DEFAULT_CHARSET = "0123456789:. "
+
+# Maximum number of string layouts remembered per atlas
+LAYOUT_CACHE_SIZE = 64
+
+
+class GlyphAtlas:
+    """Bitmap text renderer for frequently changing strings.
+
+    Every character is rasterized once with the face and colors of a `Font`,
+    drop shadow included, into a single atlas surface. Drawing a string is then one batched
+    `blits` call of atlas areas, positioned with cached advances and kerning.
+    """
+
+    # Shared atlases, keyed by font style
+    _atlases = {}
+
+    @classmethod
+    def for_font(cls, font: Font, charset: str = DEFAULT_CHARSET):
+        """Return the shared atlas for a font, creating it if needed."""
+        atlas = cls._atlases.get(font.style)
+        if atlas is None:
+            atlas = cls(font, charset)
+            cls._atlases[font.style] = atlas
+        else:
+            atlas.add_characters(charset)
+        return atlas
+
+    def __init__(self, font: Font, charset: str = DEFAULT_CHARSET):
+        self.font = font
+        self.surface = None
+        self.height = 0
+        self._glyphs = {}
+        self._shadows = {}
+        self._advances = {}
+        self._kerning = {}
+        self._layouts = {}
+        self._charset = ""
+        self.add_characters(charset)
+
+    def add_characters(self, charset: str):
+        """Add characters to the atlas, rebuilding it if any are new."""
+        missing = "".join(sorted(set(charset) - set(self._charset)))
+        if missing:
+            self._charset += missing
+            self._build()
+
+    def _build(self):
+        font = self.font
+        face = font.font
+        glyph_surfaces = [
+            (char, face.render(char, font.antialiased, font.color))
+            for char in self._charset
+        ]
+        width = sum(surface.get_width() for _, surface in glyph_surfaces)
+        glyph_height = max(surface.get_height() for _, surface in glyph_surfaces)
+        self.height = glyph_height + (abs(font.shadow_offset[1]) if font.shadow else 0)
+
+        # Glyphs go in the top row, their drop shadows in the bottom row
+        rows = 2 if font.shadow else 1
+        self.surface = pygame.Surface(
+            (max(width, 1), glyph_height * rows), pygame.SRCALPHA
+        )
+        self._glyphs.clear()
+        self._shadows.clear()
+        self._layouts.clear()
+
+        x = 0
+        for char, glyph in glyph_surfaces:
+            glyph_width = glyph.get_width()
+            self.surface.blit(glyph, (x, 0))
+            self._glyphs[char] = pygame.Rect(x, 0, glyph_width, glyph_height)
+            if font.shadow:
+                shadow = face.render(char, font.antialiased, font.shadow_color)
+                self.surface.blit(shadow, (x, glyph_height))
+                self._shadows[char] = pygame.Rect(
+                    x, glyph_height, glyph_width, glyph_height
+                )
+            self._advances[char] = face.size(char)[0]
+            x += glyph_width
+
+        logger.debug(
+            f"Built glyph atlas of {len(self._charset)} characters "
+            f"({self.surface.get_width()}x{self.surface.get_height()})"
+        )
+
+    def _kern(self, left: str, right: str) -> int:
+        pair = left + right
+        kerning = self._kerning.get(pair)
+        if kerning is None:
+            face = self.font.font
+            kerning = face.size(pair)[0] - self._advances[left] - self._advances[right]
+            self._kerning[pair] = kerning
+        return kerning
+
+    def layout(self, text: str) -> list:
+        """Offsets and atlas areas of every blit needed to draw `text`.
+
+        All shadows come first so no shadow covers a neighbouring glyph,
+        matching what `Font.render` produces for the whole string.
+        """
+        layout = self._layouts.get(text)
+        if layout is not None:
+            return layout
+
+        self.add_characters(text)
+        pen_positions = []
+        pen_x = 0
+        previous = None
+        for char in text:
+            if previous is not None:
+                pen_x += self._kern(previous, char)
+            pen_positions.append((pen_x, char))
+            pen_x += self._advances[char]
+            previous = char
+
+        layout = []
+        if self.font.shadow:
+            shadow_x, shadow_y = self.font.shadow_offset
+            for pen_x, char in pen_positions:
+                layout.append((pen_x + shadow_x, shadow_y, self._shadows[char]))
+        for pen_x, char in pen_positions:
+            layout.append((pen_x, 0, self._glyphs[char]))
+
+        if len(self._layouts) >= LAYOUT_CACHE_SIZE:
+            self._layouts.clear()
+        self._layouts[text] = layout
+        return layout
+
+    def measure(self, text: str) -> tuple[int, int]:
+        """Size of the drawn text, including its drop shadow."""
+        width = max(
+            (offset_x + rect.width for offset_x, _, rect in self.layout(text)),
+            default=0,
+        )
+        return width, self.height
+
+    def draw(self, target, text: str, position: tuple[int, int]):
+        """Draw `text` onto `target` with a single batched blit call."""
+        x, y = position
+        atlas = self.surface
+        target.blits(
+            [
+                (atlas, (x + offset_x, y + offset_y), rect)
+                for offset_x, offset_y, rect in self.layout(text)
+            ],
+            doreturn=False,
+        )
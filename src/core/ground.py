@@ -1,5 +1,7 @@
 import pygame
-from pathlib import Path
+from core.assets import ImageRegistry, asset_path
+from core.resolution import scaled_size
+from core.scrolling_layer import ScrollingLayer
 from core.logs import get_logger
 
 logger = get_logger("Ground")
@@ -7,32 +9,46 @@ logger = get_logger("Ground")
 
 class Ground:
     def __init__(
-        self, screen_width, screen_height, ground_level, image="ground_tile.png"
+        self,
+        screen_width,
+        screen_height,
+        ground_level,
+        image="ground_tile.png",
+        parallax=1.0,
+        scale=1.0,
     ):
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.ground_level = ground_level
+        self.scale = scale
 
         # Load the tileable ground image
-        self.image_path = (
-            Path(__file__).parent.parent.parent / "assets" / "ground" / image
-        )
+        self.image_path = asset_path("ground", image)
+        registry = ImageRegistry.get_instance()
         try:
-            self.ground_image = pygame.image.load(self.image_path).convert_alpha()
+            self.ground_image = registry.load(self.image_path)
+            if scale != 1:
+                # Tiles follow the logical resolution the ground is drawn at
+                self.ground_image = registry.load(
+                    self.image_path, scaled_size(self.ground_image.get_size(), scale)
+                )
         except FileNotFoundError:
             logger.error(f"Ground image '{image}' not found. Using fallback color.")
-            self.ground_image = pygame.Surface((100, 50))  # Fallback size
+            # Fallback size
+            self.ground_image = pygame.Surface(scaled_size((100, 50), scale))
             self.ground_image.fill((139, 69, 19))  # Brown color
 
-        # Scale the ground image if necessary
-        self.ground_image = pygame.transform.scale(
+        self.tile_width = self.ground_image.get_width()
+
+        # Tiles are composited into a scrolling strip covering the screen width
+        self.layer = ScrollingLayer(
             self.ground_image,
-            (self.ground_image.get_width(), self.ground_image.get_height()),
+            round(screen_width * scale),
+            y=round(ground_level * scale),
+            parallax=parallax,
+            scale=scale,
         )
 
-        self.tile_width = self.ground_image.get_width()
-
-    def render(self, surface, offset_x=0):
-        # Draw the ground image repeatedly across the screen width
-        for x in range(-self.tile_width, self.screen_width, self.tile_width):
-            surface.blit(self.ground_image, (x + offset_x, self.ground_level))
+    def render(self, surface, offset_x=None, alpha=1.0):
+        # One blit of the visible window, whatever the offset
+        self.layer.draw(surface, offset_x, alpha)
@@ -2,14 +2,22 @@ import logging
 import os
 
 logs_dir = "logs"
-os.makedirs(logs_dir, exist_ok=True)
+
+
+class _LazyFileHandler(logging.FileHandler):
+    """File handler that creates the log directory and file on first write."""
+
+    def _open(self):
+        os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+        return super()._open()
+
 
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     handlers=[
         logging.StreamHandler(),
-        logging.FileHandler(os.path.join(logs_dir, "game.log")),
+        _LazyFileHandler(os.path.join(logs_dir, "game.log"), delay=True),
     ],
 )
 
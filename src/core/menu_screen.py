@@ -0,0 +1,84 @@
+import pygame
+
+from core.background import Background
+from core.text import Text
+
+
+class MenuScreen:
+    """Retained-mode screen for static menus.
+
+    The background and static labels are composited once into a base
+    surface. Each option keeps pre-rendered unselected and selected
+    variants, so moving the selection only redraws and presents the two
+    option rectangles that changed. Frames where nothing changed cost no
+    drawing at all.
+    """
+
+    def __init__(self, game, background: Background, labels=()):
+        self.game = game
+        self.background = background
+        self.labels = list(labels)
+        self.options = []
+        self.option_rects = []
+        self._base = None
+        self._drawn_selection = None
+
+    def set_labels(self, labels):
+        """Replace the static labels, recompositing the base on next render."""
+        self.labels = list(labels)
+        self._base = None
+
+    def set_options(self, options):
+        """Set the options as `(unselected Text, selected Text)` pairs."""
+        self.options = list(options)
+        self.option_rects = [
+            pygame.Rect(normal.position, normal.get_size()).union(
+                pygame.Rect(selected.position, selected.get_size())
+            )
+            for normal, selected in self.options
+        ]
+        self.invalidate()
+
+    def add_option(self, normal: Text, highlighted: Text):
+        """Append an option with its unselected and selected variants."""
+        self.set_options(self.options + [(normal, highlighted)])
+
+    def invalidate(self):
+        """Force a full redraw, e.g. after the window was exposed."""
+        self._drawn_selection = None
+
+    def render(self, selected: int):
+        screen = self.game.screen
+
+        if self._base is None:
+            self._compose()
+            self._drawn_selection = None
+
+        if self._drawn_selection is None:
+            screen.blit(self._base, (0, 0))
+            for i in range(len(self.options)):
+                self._draw_option(screen, i, selected)
+            self.game.present()
+        elif selected != self._drawn_selection:
+            changed = [
+                i
+                for i in (self._drawn_selection, selected)
+                if 0 <= i < len(self.options)
+            ]
+            for i in changed:
+                rect = self.option_rects[i]
+                screen.blit(self._base, rect, rect)
+                self._draw_option(screen, i, selected)
+            self.game.present([self.option_rects[i] for i in changed])
+
+        self._drawn_selection = selected
+
+    def _compose(self):
+        self._base = pygame.Surface(self.game.screen.get_size()).convert()
+        self.background.render(self._base)
+        for label in self.labels:
+            label.render(self._base)
+
+    def _draw_option(self, screen, index: int, selected: int):
+        normal, highlighted = self.options[index]
+        (highlighted if index == selected else normal).render(screen)
@@ -1,29 +1,69 @@
+from collections import defaultdict
+
 import pygame
 
 
 class BaseObstacle:
+    # Pixels moved left per simulation step
+    SPEED = 10
+
+    # Obstacles are pooled and reset in place, they carry no other state
+    __slots__ = ("x", "previous_x", "y", "texture", "rect")
+
     def __init__(self, x, y, texture):
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.reset(x, y, texture)
+
+    def reset(self, x, y, texture):
+        """Place the obstacle as if it was just created."""
         self.x = x
+        self.previous_x = x
         self.y = y
         self.texture = texture
-        self.rect = pygame.Rect(x, y, texture.get_width(), texture.get_height())
+        width, height = texture.get_size() if texture else (0, 0)
+        self.rect.update(x, y, width, height)
 
     def update(self):
-        self.x -= 10
+        self.previous_x = self.x
+        self.x -= self.SPEED
         self.rect.x = self.x
 
-    def draw(self, surface):
+    def draw_x(self, alpha=1.0):
+        """Horizontal position interpolated between the last two steps."""
+        return round(self.previous_x + (self.x - self.previous_x) * alpha)
+
+    def draw(self, surface, alpha=1.0):
         if self.texture:
-            surface.blit(self.texture, (self.x, self.y))
+            surface.blit(self.texture, (self.draw_x(alpha), self.y))
 
 
 class SmallObstacle(BaseObstacle):
-    pass
+    __slots__ = ()
 
 
 class TallObstacle(BaseObstacle):
-    pass
+    __slots__ = ()
 
 
 class WideObstacle(BaseObstacle):
-    pass
+    __slots__ = ()
+
+
+class ObstaclePool:
+    """Culled obstacles kept for reuse, so spawning does not allocate."""
+
+    def __init__(self):
+        self._free = defaultdict(list)
+        self.created = 0
+
+    def acquire(self, obstacle_class, x, y, texture):
+        free = self._free[obstacle_class]
+        if free:
+            obstacle = free.pop()
+            obstacle.reset(x, y, texture)
+            return obstacle
+        self.created += 1
+        return obstacle_class(x, y, texture)
+
+    def release(self, obstacle):
+        self._free[obstacle.__class__].append(obstacle)
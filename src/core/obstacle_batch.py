@@ -0,0 +1,168 @@
+import numpy as np
+import pygame
+
+from core.logs import get_logger
+from core.obstacle import BaseObstacle
+from core.obstacle_manager import ObstacleManager
+from core.render_queue import rect_surface
+from core.resolution import scaled_size
+
+logger = get_logger("ObstacleBatch")
+
+# Rows allocated up front, the arrays double whenever they fill up
+INITIAL_CAPACITY = 64
+
+
+class ObstacleBatch(ObstacleManager):
+    """Obstacle manager that keeps obstacles in NumPy arrays.
+
+    Rather than one object per obstacle, each obstacle is a row in arrays of
+    positions, sizes and texture ids, so moving, culling, scoring and
+    collision tests are a few vectorized operations however many obstacles
+    there are. Like the object backend, rows are in spawn order, which is x
+    order. Rows leave from the front by advancing `head`, and the live rows
+    are moved back to the start when the arrays run out of room.
+
+    Spawning makes the same random choices as ObstacleManager, so a seeded
+    game plays the same on both backends.
+    """
+
+    HAS_OBSTACLE_OBJECTS = False
+
+    # One array per obstacle attribute, all indexed by row
+    COLUMNS = ("x", "previous_x", "y", "width", "height", "texture_id")
+
+    def __init__(self, screen_width, ground_level, clock, rng, jump_arc=None):
+        super().__init__(screen_width, ground_level, clock, rng, jump_arc)
+        self.obstacles = None
+
+        # Texture ids index this list
+        self.texture_table = [
+            texture
+            for texture_list in self.textures.values()
+            for texture in texture_list
+        ]
+        self._texture_ids = {
+            texture: texture_id for texture_id, texture in enumerate(self.texture_table)
+        }
+
+        for column in self.COLUMNS:
+            setattr(self, column, np.zeros(INITIAL_CAPACITY, dtype=np.int64))
+        self.head = 0
+        self.tail = 0
+
+    def __len__(self):
+        return self.tail - self.head
+
+    def _make_room(self):
+        live = slice(self.head, self.tail)
+        count = self.tail - self.head
+        capacity = len(self.x)
+        if count * 2 > capacity:
+            capacity *= 2
+        for column in self.COLUMNS:
+            resized = np.zeros(capacity, dtype=np.int64)
+            resized[:count] = getattr(self, column)[live]
+            setattr(self, column, resized)
+        self.head = 0
+        self.tail = count
+
+    def add(self, x, texture):
+        """Append an obstacle with its left edge at `x`."""
+        if self.tail == len(self.x):
+            self._make_room()
+        row = self.tail
+        width, height = texture.get_size()
+        self.x[row] = self.previous_x[row] = x
+        self.y[row] = self.ground_level - height
+        self.width[row] = width
+        self.height[row] = height
+        self.texture_id[row] = self._texture_ids[texture]
+        self.tail += 1
+
+    def _drop_leading(self, right_of) -> int:
+        """Drop the rows at the front whose last step was all left of `right_of`."""
+        live = slice(self.head, self.tail)
+        left_of = self.previous_x[live] + self.width[live] < right_of
+        count = len(left_of) if left_of.all() else int(left_of.argmin())
+        self.head += count
+        return count
+
+    def update(self):
+        self.step += 1
+        due = self.schedule.pop_due(self.step)
+        if due is not None:
+            self.add(self.screen_width, due[1])
+
+        live = slice(self.head, self.tail)
+        self.previous_x[live] = self.x[live]
+        self.x[live] -= BaseObstacle.SPEED
+        if self._drop_leading(0):
+            logger.debug("Removed obstacles that are out of view")
+
+    def get_passed_obstacles(self, player_x):
+        return self._drop_leading(player_x)
+
+    def _candidates(self, bounds):
+        # Only rows left of the bounds' right edge can reach them
+        x = self.x[self.head : self.tail]
+        end = self.head + int(np.searchsorted(x, bounds.right))
+        window = slice(self.head, end)
+        x = self.x[window]
+        y = self.y[window]
+        width = self.width[window]
+        height = self.height[window]
+        previous_x = self.previous_x[window]
+        rows = np.flatnonzero(
+            (x < bounds.right)
+            & (previous_x + width > bounds.left)
+            & (y < bounds.bottom)
+            & (y + height > bounds.top)
+        )
+        for row in rows.tolist():
+            yield (
+                pygame.Rect(
+                    int(x[row]), int(y[row]), int(width[row]), int(height[row])
+                ),
+                int(previous_x[row]),
+                self.texture_table[self.texture_id[self.head + row]],
+            )
+
+    def draw(self, surface, alpha=1.0):
+        # Interpolate and cull the whole batch, then submit the visible
+        # obstacles and their hitboxes in one blits call
+        live = slice(self.head, self.tail)
+        previous_x = self.previous_x[live]
+        draw_x = np.rint(previous_x + (self.x[live] - previous_x) * alpha)
+        visible = np.flatnonzero(
+            (draw_x < self.screen_width) & (draw_x + self.width[live] > 0)
+        )
+        if not len(visible):
+            return
+
+        scale = self.render_scale
+        rows = visible + self.head
+        columns = zip(
+            (draw_x[visible] * scale).round().astype(np.int64).tolist(),
+            (self.y[rows] * scale).round().astype(np.int64).tolist(),
+            self.width[rows].tolist(),
+            self.height[rows].tolist(),
+            self.texture_id[rows].tolist(),
+        )
+
+        textures = self.texture_table
+        if scale != 1:
+            textures = [self.render_textures[texture] for texture in textures]
+        blits = []
+        for x, y, width, height, texture_id in columns:
+            blits.append((textures[texture_id], (x, y)))
+            # DEBUG: Obstacle hitbox, a 1-pixel border
+            size = scaled_size((width, height), scale)
+            blits.append((rect_surface(size, (0, 0, 0), 1), (x, y)))
+        surface.blits(blits, doreturn=False)
+
+    def reset(self):
+        self.head = self.tail = 0
+        self.step = 0
+        self.schedule = self._new_schedule()
+        logger.info("ObstacleBatch reset")
@@ -1,56 +1,78 @@
-import os
+from collections import deque
+
 import pygame
-from .obstacle import SmallObstacle, TallObstacle, WideObstacle
-import random
+from .obstacle import ObstaclePool, SmallObstacle, TallObstacle, WideObstacle
+from core.assets import ImageRegistry, list_assets
+from core.collision import MaskCache, masks_overlap, sweep
 from core.logs import get_logger
+from core.render_queue import rect_surface
+from core.resolution import scale_rect, scaled_size
+from core.spawn_schedule import SpawnSchedule
 
 logger = get_logger("ObstacleManager")
 
 
 class ObstacleManager:
-    def __init__(self, screen_width, ground_level):
+    # Obstacle textures are drawn at twice their pixel size
+    TEXTURE_SCALE = 2
+
+    # Whether `obstacles` holds obstacle objects, which the dirty-rectangle
+    # renderer tracks as sprites
+    HAS_OBSTACLE_OBJECTS = True
+
+    def __init__(self, screen_width, ground_level, clock, rng, jump_arc=None):
         self.screen_width = screen_width
         self.ground_level = ground_level
-        self.obstacles = []
-        self.last_obstacle_time = 0
-        self.next_obstacle_interval = random.randint(600, 1500)
+        self.clock = clock
+        self.rng = rng
+        # Obstacles spawn at the right edge and all move left at the same
+        # speed, so the queue stays ordered by x, with the leftmost in front
+        self.obstacles = deque()
+        if self.HAS_OBSTACLE_OBJECTS:
+            self.pool = ObstaclePool()
         self.spawn_y = ground_level
-        self.paused = False
-        self.pause_start_time = 0
-        self.pause_accumulated_time = 0
+        # Steps simulated since the last reset, which the schedule counts in
+        self.step = 0
+        self.jump_arc = jump_arc
 
         # Load obstacle textures
+        self.texture_sources = {}
         self.textures = self._load_obstacle_textures()
 
+        # Pixel-perfect collisions test the textures' masks
+        self.masks = MaskCache.get_instance()
+        for texture_list in self.textures.values():
+            self.masks.build(texture_list)
+
+        # Textures as drawn at the logical render scale
+        self.render_scale = 1.0
+        self.render_textures = {}
+
+        self.schedule = self._new_schedule()
+
         logger.debug(
             f"ObstacleManager initialized with screen_width={screen_width}, ground_level={ground_level}"
         )
 
     def _load_obstacle_textures(self):
-        base_path = "assets/obstacle"
+        registry = ImageRegistry.get_instance()
         textures = {"small": [], "tall": [], "wide": []}
-        scale_factor = 2
+        scale_factor = self.TEXTURE_SCALE
 
         try:
             for obstacle_type in textures.keys():
-                dir_path = os.path.join(base_path, obstacle_type)
-                if os.path.exists(dir_path):
-                    for file_name in os.listdir(dir_path):
-                        if file_name.endswith(".png"):
-                            texture_path = os.path.join(dir_path, file_name)
-                            texture = pygame.image.load(texture_path).convert_alpha()
-
-                            # Texture scaling
-                            original_size = texture.get_size()
-                            scaled_size = (
-                                original_size[0] * scale_factor,
-                                original_size[1] * scale_factor,
-                            )
-                            scaled_texture = pygame.transform.scale(
-                                texture, scaled_size
-                            )
-
-                            textures[obstacle_type].append(scaled_texture)
+                for texture_path in list_assets("obstacle", obstacle_type):
+                    # The registry keeps the scaled texture, so only the
+                    # unscaled size is needed to build its key
+                    original_size = registry.load(texture_path).get_size()
+                    scaled_size = (
+                        original_size[0] * scale_factor,
+                        original_size[1] * scale_factor,
+                    )
+                    scaled_texture = registry.load(texture_path, scaled_size)
+
+                    textures[obstacle_type].append(scaled_texture)
+                    self.texture_sources[scaled_texture] = texture_path
 
                 if not textures[obstacle_type]:
                     logger.warning(
@@ -83,96 +105,200 @@ class ObstacleManager:
 
         return textures
 
-    def _spawn_obstacle(self):
+    def _choose_obstacle(self):
         obstacle_classes = [
             (SmallObstacle, self.textures["small"]),
             (TallObstacle, self.textures["tall"]),
             (WideObstacle, self.textures["wide"]),
         ]
-        obstacle_class, texture_list = random.choice(obstacle_classes)
-        texture = random.choice(texture_list) if texture_list else None
+        obstacle_class, texture_list = self.rng.choice(obstacle_classes)
+        texture = self.rng.choice(texture_list) if texture_list else None
+        return obstacle_class, texture
+
+    def _new_schedule(self):
+        return SpawnSchedule(
+            self._choose_obstacle,
+            self.rng,
+            self.clock.step_ms,
+            self.screen_width,
+            self.jump_arc,
+        )
 
-        texture_width = texture.get_width() if texture else 0
+    def _spawn_obstacle(self, obstacle_class, texture):
         texture_height = texture.get_height() if texture else 0
         y_position = self.ground_level - texture_height
 
-        obstacle = obstacle_class(
-            x=self.screen_width,
-            y=y_position,
-            texture=texture,
-        )
-        obstacle.rect = pygame.Rect(
-            obstacle.x, obstacle.y, texture_width, texture_height
-        )
-
-        return obstacle
+        # Reuses a culled obstacle of the class when there is one
+        return self.pool.acquire(obstacle_class, self.screen_width, y_position, texture)
 
     def update(self):
-        if self.paused:
-            return
+        self.step += 1
+        due = self.schedule.pop_due(self.step)
+        if due is not None:
+            self.obstacles.append(self._spawn_obstacle(*due))
 
-        current_time = pygame.time.get_ticks()
-        elapsed_time = (
-            current_time - self.last_obstacle_time - self.pause_accumulated_time
-        )
-
-        if elapsed_time > self.next_obstacle_interval:
-            new_obstacle = self._spawn_obstacle()
-            self.obstacles.append(new_obstacle)
-            self.last_obstacle_time = current_time
-            self.pause_accumulated_time = 0
-            self.next_obstacle_interval = random.randint(600, 1500)
-
-        for obstacle in self.obstacles[:]:
+        obstacles = self.obstacles
+        for obstacle in obstacles:
             obstacle.update()
-            if obstacle.rect.right < 0:
-                self.obstacles.remove(obstacle)
-                logger.debug("Removed obstacle that is out of view")
+        # Kept until the whole span they swept over the step is out of view
+        while obstacles and obstacles[0].previous_x + obstacles[0].rect.width < 0:
+            self.pool.release(obstacles.popleft())
+            logger.debug("Removed obstacle that is out of view")
+
+    def check_collisions(
+        self, player_rect, player_mask=None, mask_position=None, previous_rect=None
+    ):
+        """Test the player against the obstacles.
 
-    def check_collisions(self, player_rect):
+        Rectangles that overlap `player_rect` are the candidates. Given the
+        player's mask at `mask_position`, a candidate only collides where
+        the opaque pixels of both overlap. Given the player's rect before
+        the last step, `previous_rect`, the test is swept over the step,
+        so obstacles that passed through the player during it collide too.
+        """
+        bounds = (
+            player_rect if previous_rect is None else player_rect.union(previous_rect)
+        )
+        player = (player_rect, player_mask, mask_position, previous_rect)
         collision = any(
-            obstacle.rect.colliderect(player_rect) for obstacle in self.obstacles
+            self._collides(rect, start_x, texture, *player)
+            for rect, start_x, texture in self._candidates(bounds)
         )
         if collision:
             logger.info("Player collision detected")
         return collision
 
-    def draw(self, surface):
+    def time_of_impact(self, previous_rect, player_rect):
+        """Fraction of the last step at which the player first hit an obstacle.
+
+        Both the player and the obstacles are swept over the step, so hits
+        are found even when they no longer overlap at its end. None if the
+        player hit nothing.
+        """
+        impact = None
+        bounds = player_rect.union(previous_rect)
+        for rect, start_x, _ in self._candidates(bounds):
+            overlap = sweep(
+                previous_rect, player_rect, rect.move(start_x - rect.x, 0), rect
+            )
+            if overlap is not None and (impact is None or overlap[0] < impact):
+                impact = overlap[0]
+        return impact
+
+    def _candidates(self, bounds):
+        """Rect, start x and texture of obstacles whose last step reached `bounds`."""
+        # Obstacles are in x order, so none after the first one right of the
+        # bounds can reach them
+        for obstacle in self.obstacles:
+            rect = obstacle.rect
+            if rect.left >= bounds.right:
+                break
+            if (
+                obstacle.previous_x + rect.width > bounds.left
+                and rect.top < bounds.bottom
+                and rect.bottom > bounds.top
+            ):
+                yield rect, obstacle.previous_x, obstacle.texture
+
+    def _collides(
+        self,
+        rect,
+        start_x,
+        texture,
+        player_rect,
+        player_mask,
+        mask_position,
+        previous_rect,
+    ):
+        if previous_rect is None:
+            if not rect.colliderect(player_rect):
+                return False
+            time = 1.0
+        else:
+            overlap = sweep(
+                previous_rect, player_rect, rect.move(start_x - rect.x, 0), rect
+            )
+            if overlap is None:
+                return False
+            # Pixels are tested where the rects overlap at the end of the
+            # step, or halfway through an overlap the step passed through
+            entry, exit = overlap
+            time = 1.0 if exit == 1.0 else (entry + exit) / 2
+
+        if player_mask is None or texture is None:
+            return True
+        back = 1 - time
+        position = (round(rect.x + (start_x - rect.x) * back), rect.y)
+        if previous_rect is not None:
+            mask_position = (
+                mask_position[0] + round((previous_rect.x - player_rect.x) * back),
+                mask_position[1] + round((previous_rect.y - player_rect.y) * back),
+            )
+        return masks_overlap(
+            self.masks.mask(texture), position, player_mask, mask_position
+        )
+
+    def set_render_scale(self, scale):
+        """Load the textures at the size they are drawn at for a render scale."""
+        self.render_scale = scale
+        self.render_textures = {}
+        if scale == 1:
+            return
+
+        registry = ImageRegistry.get_instance()
+        for texture_list in self.textures.values():
+            for texture in texture_list:
+                size = scaled_size(texture.get_size(), scale)
+                path = self.texture_sources.get(texture)
+                self.render_textures[texture] = (
+                    registry.load(path, size)
+                    if path
+                    else pygame.transform.scale(texture, size)
+                )
+
+    def draw(self, surface, alpha=1.0):
+        scale = self.render_scale
         for obstacle in self.obstacles:
-            obstacle.draw(surface)
+            if scale == 1:
+                obstacle.draw(surface, alpha)
+            elif obstacle.texture:
+                surface.blit(
+                    self.render_textures[obstacle.texture],
+                    (
+                        round(obstacle.draw_x(alpha) * scale),
+                        round(obstacle.y * scale),
+                    ),
+                )
 
             # DEBUG: Obstacle hitbox
             if hasattr(obstacle, "rect"):
-                pygame.draw.rect(surface, (0, 0, 0), obstacle.rect, 1)  # 1-pixel border
+                rect = scale_rect(
+                    obstacle.rect.move(obstacle.draw_x(alpha) - obstacle.x, 0), scale
+                )
+                surface.blit(
+                    rect_surface(rect.size, (0, 0, 0), 1), rect
+                )  # 1-pixel border
 
     def reset(self):
-        self.obstacles = []
-        self.last_obstacle_time = pygame.time.get_ticks()
-        self.next_obstacle_interval = random.randint(600, 1500)
-        self.pause_accumulated_time = 0
+        for obstacle in self.obstacles:
+            self.pool.release(obstacle)
+        self.obstacles.clear()
+        self.step = 0
+        self.schedule = self._new_schedule()
         logger.info("ObstacleManager reset")
-        logger.debug(
-            f"ObstacleManager reset: last_obstacle_time={self.last_obstacle_time}, next_obstacle_interval={self.next_obstacle_interval}"
-        )
         logger.debug(f"Obstacles cleared: {self.obstacles}")
 
-    def pause(self):
-        if not self.paused:
-            self.paused = True
-            self.pause_start_time = pygame.time.get_ticks()
-            logger.debug("ObstacleManager paused")
-
-    def resume(self):
-        if self.paused:
-            self.paused = False
-            pause_duration = pygame.time.get_ticks() - self.pause_start_time
-            self.pause_accumulated_time += pause_duration
-            logger.debug(f"ObstacleManager resumed after {pause_duration} ms")
-
     def get_passed_obstacles(self, player_x):
-        passed_obstacles = [
-            obstacle for obstacle in self.obstacles if obstacle.rect.right < player_x
-        ]
-        for obstacle in passed_obstacles:
-            self.obstacles.remove(obstacle)
-        return len(passed_obstacles)
+        """Drop and count the obstacles whose last step was all left of `player_x`.
+
+        Call it after testing collisions, which need the obstacles that
+        passed through the player during the step.
+        """
+        obstacles = self.obstacles
+        passed_obstacles = 0
+        while (
+            obstacles and obstacles[0].previous_x + obstacles[0].rect.width < player_x
+        ):
+            self.pool.release(obstacles.popleft())
+            passed_obstacles += 1
+        return passed_obstacles
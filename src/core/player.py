@@ -1,12 +1,19 @@
 import pygame
-import os
 
+from core.assets import ImageRegistry, asset_path
 from core.logs import get_logger
+from core.render_queue import rect_surface
+from core.resolution import scale_rect, scaled_size
+from core.sprite_sheet import SpriteSheet
 
 logger = get_logger("Player")
 
 
 class Player:
+    SPRITE_SHEET = asset_path("player", "player.png")
+    FRAME_SIZE = (32, 32)
+    SCALE = 5
+
     def __init__(self, x, y):
         self.x = x
         self.y = y
@@ -17,13 +24,19 @@ class Player:
 
         # Animation properties
         self.sprite_sheet = None
-        self.frames = []
+        self.frames = ()
+        self.frame_areas = ()
         self.current_frame = 0
         self.animation_speed = 0.15
         self.animation_timer = 0
 
         # Player scale
-        self.scale = 5
+        self.scale = self.SCALE
+
+        # Frames as drawn at the logical render scale, the game-scale frames
+        # above still define the hitbox
+        self.render_scale = 1.0
+        self.render_frames = self.frames
 
         # Offset to sprite positioning
         self.sprite_offset_x = -2
@@ -33,90 +46,45 @@ class Player:
         self.rect = pygame.Rect(x, y, 50, 80)
 
         # Attempt to load sprite sheet
-        sprite_path = "assets/player/player.png"
-        if os.path.exists(sprite_path):
-            self.load_sprite_sheet(sprite_path, 32, 32)
-        else:
+        sprite_path = self.SPRITE_SHEET
+        try:
+            self.load_sprite_sheet(sprite_path, *self.FRAME_SIZE)
+        except FileNotFoundError:
             logger.warning(
                 f"Sprite sheet '{sprite_path}' not found. Using rectangle as fallback."
             )
 
+        # Height before the last simulation step, for interpolated drawing
+        self.previous_y = self.rect.y
+
     def load_sprite_sheet(self, filename, frame_width, frame_height):
-        try:
-            # Load sprite sheet
-            self.sprite_sheet = pygame.image.load(filename).convert_alpha()
-
-            sheet_width, sheet_height = self.sprite_sheet.get_size()
-            cols = sheet_width // frame_width
-            rows = sheet_height // frame_height
-
-            # Extract each frame from the sprite sheet
-            for row in range(rows):
-                for col in range(cols):
-                    frame = pygame.Surface((frame_width, frame_height), pygame.SRCALPHA)
-
-                    frame.blit(
-                        self.sprite_sheet,
-                        (0, 0),
-                        (
-                            col * frame_width,
-                            row * frame_height,
-                            frame_width,
-                            frame_height,
-                        ),
-                    )
-
-                    # Scale the tile
-                    scaled_frame = pygame.transform.scale(
-                        frame, (frame_width * self.scale, frame_height * self.scale)
-                    )
-
-                    self.frames.append(scaled_frame)
-
-            if self.frames:
-                self.calculate_hitbox(self.frames[0])
-
-            logger.debug(f"Loaded {len(self.frames)} frames from sprite sheet")
-
-        except Exception as e:
-            logger.error(f"Error loading sprite sheet: {e}")
-
-    def calculate_hitbox(self, frame):
-        "Find the bounding box by using the non-transparent pixels from the sprite sheet"
-        mask = pygame.mask.from_surface(frame)
-        if mask.count() > 0:
-            # Get all non-transparent areas
-            bounds_list = mask.get_bounding_rects()
-
-            # If there are multiple non-transparent regions, combine them
-            if bounds_list:
-                # Get the overall bounding rectangle that contains all non-transparent regions
-                min_x = min(rect.left for rect in bounds_list)
-                min_y = min(rect.top for rect in bounds_list)
-                max_x = max(rect.right for rect in bounds_list)
-                max_y = max(rect.bottom for rect in bounds_list)
-
-                # Calculate offsets between sprite and hitbox
-                self.sprite_offset_x = min_x
-                self.sprite_offset_y = min_y
-
-                # Create a hitbox with the calculated dimensions
-                width = max_x - min_x
-                height = max_y - min_y
-
-                # Place the hitbox properly (centered horizontally, bottom aligned)
-                self.rect = pygame.Rect(self.x, self.y, width, height)
-        else:
-            # Fallback to a reasonable size if no non-transparent pixels found
-            frame_width, frame_height = frame.get_size()
-            self.rect = pygame.Rect(
-                self.x,
-                self.y,
-                frame_width // 2,
-                frame_height // 2,
-            )
+        # The frames and their hitboxes are sliced once per process and
+        # shared (missing files propagate to the caller)
+        sheet = SpriteSheet.load(filename, (frame_width, frame_height), self.scale)
+        self.sprite_sheet = sheet
+        self.frames = sheet.frames
+        self.frame_areas = sheet.areas
+        self.render_frames = self.frames
+        if self.frames:
+            # Place the hitbox of the first frame at the player's position
+            self.rect = pygame.Rect((self.x, self.y), sheet.hitboxes[0].size)
+            self.sprite_offset_x, self.sprite_offset_y = sheet.offsets[0]
+
+    def set_render_scale(self, scale: float):
+        """Load the frames at the size they are drawn at for a render scale."""
+        self.render_scale = scale
+        if scale == 1 or not self.frames:
+            self.render_frames = self.frames
+            return
+
+        registry = ImageRegistry.get_instance()
+        size = scaled_size(self.frames[0].get_size(), scale)
+        self.render_frames = [
+            registry.load(self.SPRITE_SHEET, size, area) for area in self.frame_areas
+        ]
 
     def update(self, ground_level):
+        self.previous_y = self.rect.y
         self.velocity += self.gravity
         self.rect.y += self.velocity
 
@@ -132,26 +100,86 @@ class Player:
             self.animation_timer += self.animation_speed
             if self.animation_timer >= 1:
                 self.animation_timer = 0
-                self.current_frame = (self.current_frame + 1) % len(self.frames)
+                self.set_frame((self.current_frame + 1) % len(self.frames))
+
+    def set_frame(self, index: int):
+        """Show an animation frame, fitting the hitbox to its opaque pixels.
+
+        The frame is drawn where the previous one was horizontally, and the
+        bottom of the hitbox stays put, so the player keeps standing on the
+        ground.
+        """
+        self.current_frame = index
+        hitbox = self.sprite_sheet.hitboxes[index]
+        offset_x, offset_y = self.sprite_sheet.offsets[index]
+
+        rect = self.rect
+        top, bottom = rect.top, rect.bottom
+        rect.x += offset_x - self.sprite_offset_x
+        rect.size = hitbox.size
+        rect.bottom = bottom
+        # Resizing is not movement, so it is not interpolated
+        self.previous_y += rect.top - top
+        self.sprite_offset_x = offset_x
+        self.sprite_offset_y = offset_y
 
     def jump(self):
         if self.is_grounded:
             self.velocity = self.jump_velocity
             self.is_grounded = False
 
-    def draw(self, surface, color=(255, 0, 255)):
-        # Draw the current animation frame
+    def current_image(self):
+        """The current animation frame, or None when using the fallback."""
         if len(self.frames) > 0:
-            current_img = self.frames[self.current_frame]
+            return self.frames[self.current_frame]
+        return None
+
+    def collision_shape(self):
+        """The rect, mask, mask position and previous rect to test obstacles against.
+
+        The rect is the hitbox of the current frame, for a cheap first test,
+        and the previous rect is where it was before the last step. The mask
+        is None when using the fallback rectangle.
+        """
+        rect = self.rect
+        mask = position = None
+        if self.frames:
+            mask = self.sprite_sheet.masks[self.current_frame]
+            position = self.sprite_position()
+        return rect, mask, position, rect.move(0, self.previous_y - rect.y)
+
+    def extent(self) -> tuple:
+        """Left and right edge of what any animation frame covers."""
+        if not self.frames:
+            return self.rect.left, self.rect.right
+        x = self.rect.x - self.sprite_offset_x
+        return x + self.sprite_sheet.extent.left, x + self.sprite_sheet.extent.right
+
+    def sprite_position(self):
+        """Top-left corner of the current frame on screen."""
+        return (
+            self.rect.x - self.sprite_offset_x,
+            self.rect.y - self.sprite_offset_y,
+        )
+
+    def draw(self, surface, color=(255, 0, 255), alpha=1.0):
+        scale = self.render_scale
+
+        # Interpolate between the last two simulation steps
+        dy = round((self.previous_y - self.rect.y) * (1 - alpha))
+        rect = scale_rect(self.rect.move(0, dy), scale)
 
-            # Calculate sprite position
-            sprite_x = self.rect.x - self.sprite_offset_x
-            sprite_y = self.rect.y - self.sprite_offset_y
-
-            surface.blit(current_img, (sprite_x, sprite_y))
+        # Draw the current animation frame
+        if self.render_frames:
+            x, y = self.sprite_position()
+            y += dy
+            surface.blit(
+                self.render_frames[self.current_frame],
+                (round(x * scale), round(y * scale)),
+            )
 
             # Player hitbox
-            pygame.draw.rect(surface, (255, 0, 0), self.rect, 1)
+            surface.blit(rect_surface(rect.size, (255, 0, 0), 1), rect)
         else:
             # Fallback player sprite
-            pygame.draw.rect(surface, color, self.rect)
+            surface.blit(rect_surface(rect.size, color), rect)
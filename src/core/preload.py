@@ -0,0 +1,188 @@
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import pygame
+
+from core.assets import ImageRegistry, list_assets
+from core.font import Font, get_face
+from core.logs import get_logger
+from core.tiling_background import BRICKS_IMAGE, BRICKS_UNIT_SIZE
+
+logger = get_logger("Preloader")
+
+# Pillow decoding and pygame scaling release the GIL, so threads scale well
+MAX_WORKERS = min(8, os.cpu_count() or 2)
+
+FONT_NAME = "antiquity-print.ttf"
+FONT_SIZES = (20, 26, 30, 39, 55)
+
+
+def build_manifest(screen_size: tuple[int, int]) -> list:
+    """List every image the game loads, with the variants it needs.
+
+    Each entry is `(path, variants)`, where `variants` maps the decoded image
+    size to a list of `(target size, source area)` pairs. These pairs match
+    the registry keys used by the classes that load the images.
+    """
+    from core.obstacle_manager import ObstacleManager
+    from core.player import Player
+
+    def native(image_size):
+        return [(None, None)]
+
+    def screen(image_size):
+        return [(screen_size, None)]
+
+    def obstacle(image_size):
+        scale = ObstacleManager.TEXTURE_SCALE
+        return [(None, None), ((image_size[0] * scale, image_size[1] * scale), None)]
+
+    def sprite_sheet(image_size):
+        frame_width, frame_height = Player.FRAME_SIZE
+        scaled_size = (frame_width * Player.SCALE, frame_height * Player.SCALE)
+        return [(None, None)] + [
+            (scaled_size, (col * frame_width, row * frame_height, *Player.FRAME_SIZE))
+            for row in range(image_size[1] // frame_height)
+            for col in range(image_size[0] // frame_width)
+        ]
+
+    def bricks(image_size):
+        return [(BRICKS_UNIT_SIZE, None)]
+
+    manifest = []
+    for path in list_assets("backgrounds"):
+        manifest.append((path, bricks if path.name == BRICKS_IMAGE else screen))
+    for path in list_assets("ground"):
+        manifest.append((path, native))
+    for obstacle_type in ("small", "tall", "wide"):
+        for path in list_assets("obstacle", obstacle_type):
+            manifest.append((path, obstacle))
+    manifest.append((Player.SPRITE_SHEET, sprite_sheet))
+    return manifest
+
+
+def manifest_settings(screen_size: tuple[int, int]) -> dict:
+    """Scaling parameters that change the variants in the manifest."""
+    from core.obstacle_manager import ObstacleManager
+    from core.player import Player
+
+    return {
+        "screen_size": list(screen_size),
+        "obstacle_scale": ObstacleManager.TEXTURE_SCALE,
+        "player_frame_size": list(Player.FRAME_SIZE),
+        "player_scale": Player.SCALE,
+        "background_unit_size": list(BRICKS_UNIT_SIZE),
+    }
+
+
+def prepare_image(path, variants) -> list:
+    """Decode and scale one image in a worker thread.
+
+    Returns `(size, area, pixel size, RGBA bytes)` for every variant.
+    """
+    from PIL import Image
+
+    with Image.open(path) as image:
+        image = image.convert("RGBA")
+
+    prepared = []
+    for size, area in variants(image.size):
+        variant = image
+        if area:
+            x, y, width, height = area
+            variant = variant.crop((x, y, x + width, y + height))
+        pixels = variant.tobytes()
+        pixel_size = variant.size
+        if size and pixel_size != tuple(size):
+            # Scale with pygame so pixels match the lazily loaded path exactly
+            scaled = pygame.transform.scale(
+                pygame.image.frombuffer(pixels, pixel_size, "RGBA"), size
+            )
+            pixels = pygame.image.tobytes(scaled, "RGBA")
+            pixel_size = scaled.get_size()
+        prepared.append((size, area, pixel_size, pixels))
+    return prepared
+
+
+class Preloader:
+    """Decodes every asset in a worker pool behind a loading screen.
+
+    Workers only produce raw pixel buffers; surfaces are created and
+    converted on the main thread, which owns the display.
+    """
+
+    def __init__(self, game):
+        self.game = game
+        self.registry = ImageRegistry.get_instance()
+        self.font = Font(
+            FONT_NAME,
+            30,
+            (255, 255, 255),
+            shadow=True,
+            shadow_offset=(2, 2),
+            shadow_color=(0, 0, 0),
+        )
+
+    def run(self):
+        manifest = build_manifest((self.game.width, self.game.height))
+
+        # Open every font face the states use while the workers start up
+        for size in FONT_SIZES:
+            get_face(FONT_NAME, size)
+
+        loaded = 0
+        self._render_progress(0, len(manifest))
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = {
+                executor.submit(prepare_image, path, variants): path
+                for path, variants in manifest
+            }
+            for future in as_completed(futures):
+                path = futures[future]
+                try:
+                    self._store(path, future.result())
+                except Exception as e:
+                    # The registry will load it lazily instead
+                    logger.error(f"Failed to preload '{path}': {e}")
+
+                loaded += 1
+                self._render_progress(loaded, len(manifest))
+
+        logger.info(
+            f"Preloaded {len(manifest)} images "
+            f"({self.registry.used_bytes // 1024} KiB)"
+        )
+
+    def _store(self, path, prepared):
+        for size, area, pixel_size, pixels in prepared:
+            surface = pygame.image.frombuffer(pixels, pixel_size, "RGBA")
+            self.registry.put(
+                self.registry.make_key(path, size, area), surface.convert_alpha()
+            )
+
+    def _render_progress(self, loaded: int, total: int):
+        # Keep the window responsive while loading
+        for event in pygame.event.get(pygame.QUIT):
+            self.game.running = False
+
+        screen = self.game.screen
+        screen.fill((0, 0, 0))
+
+        label = self.font.render("Loading...")
+        screen.blit(
+            label,
+            (
+                self.game.width // 2 - label.get_width() // 2,
+                self.game.height // 2 - 60,
+            ),
+        )
+
+        bar = pygame.Rect(0, 0, self.game.width // 2, 20)
+        bar.center = (self.game.width // 2, self.game.height // 2)
+        pygame.draw.rect(screen, (255, 255, 255), bar, 2)
+
+        fill = bar.inflate(-6, -6)
+        fill.width = fill.width * loaded // max(total, 1)
+        pygame.draw.rect(screen, (255, 255, 255), fill)
+
+        self.game.present()
@@ -0,0 +1,198 @@
+import json
+import os
+import time
+from collections import deque
+from contextlib import nullcontext
+
+import pygame
+
+from core.logs import get_logger, logs_dir
+
+logger = get_logger("Profiler")
+
+# Frames kept for the overlay and trace export, a few seconds of play
+FRAME_CAPACITY = 600
+
+OVERLAY_SIZE = (300, 96)
+OVERLAY_MARGIN = 10
+# Opaque, dirty-rectangle frames do not redraw what is under the overlay
+OVERLAY_BACKGROUND = (16, 16, 16)
+GRAPH_COLOR = (90, 220, 120)
+OVER_BUDGET_COLOR = (230, 80, 60)
+
+# Returned for every scope while profiling is off
+_NO_SCOPE = nullcontext()
+
+
+class _Scope:
+    __slots__ = ("profiler", "name", "flush", "start")
+
+    def __init__(self, profiler, name, flush=None):
+        self.profiler = profiler
+        self.name = name
+        self.flush = flush
+
+    def __enter__(self):
+        self.profiler._depth += 1
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info):
+        if self.flush is not None:
+            self.flush()
+        end = time.perf_counter()
+        profiler = self.profiler
+        profiler._depth -= 1
+        profiler._scopes.append(
+            (self.name, self.start, end - self.start, profiler._depth)
+        )
+
+
+class FrameProfiler:
+    """Times the phases of each frame into a ring buffer of recent frames.
+
+    Phases are timed with `scope(name)`. Finer scopes inside a phase use
+    `detail(name, flush)`, which only records when details are on. Batched
+    drawing then flushes at the end of each detail scope, so the scope
+    times the drawing it queued. While disabled, scopes are a shared no-op
+    context manager.
+    """
+
+    def __init__(
+        self,
+        budget_ms: float,
+        enabled: bool = False,
+        details: bool = False,
+        capacity: int = FRAME_CAPACITY,
+    ):
+        self.budget_ms = budget_ms
+        self.recording = enabled
+        self.enabled = enabled
+        self.details = details
+        self.overlay = False
+        self.frames = deque(maxlen=capacity)
+        self._frame_start = None
+        self._scopes = []
+        self._depth = 0
+        self._overlay_atlas = None
+
+    def scope(self, name: str):
+        if not self.enabled:
+            return _NO_SCOPE
+        return _Scope(self, name)
+
+    def detail(self, name: str, flush=None):
+        if not self.details or not self.enabled:
+            return _NO_SCOPE
+        return _Scope(self, name, flush)
+
+    def begin_frame(self):
+        if self.enabled:
+            self._frame_start = time.perf_counter()
+            self._scopes = []
+
+    def end_frame(self):
+        if not self.enabled or self._frame_start is None:
+            return
+        end = time.perf_counter()
+        self.frames.append((self._frame_start, end - self._frame_start, self._scopes))
+        self._frame_start = None
+
+    def toggle_overlay(self):
+        """Show or hide the overlay, which profiles frames while it is shown."""
+        self.overlay = not self.overlay
+        self.enabled = self.overlay or self.recording
+        self._frame_start = None
+
+    def percentiles(self, *fractions) -> list:
+        """Frame times in milliseconds at the given fractions of the buffer."""
+        durations = sorted(frame[1] for frame in self.frames)
+        if not durations:
+            return [0.0 for _ in fractions]
+        last = len(durations) - 1
+        return [durations[round(fraction * last)] * 1000 for fraction in fractions]
+
+    def overlay_rect(self, surface: pygame.Surface) -> pygame.Rect:
+        rect = pygame.Rect((0, 0), OVERLAY_SIZE)
+        rect.bottomright = (
+            surface.get_width() - OVERLAY_MARGIN,
+            surface.get_height() - OVERLAY_MARGIN,
+        )
+        return rect
+
+    def draw_overlay(self, surface: pygame.Surface) -> pygame.Rect:
+        """Draw p50/p99 frame times and a graph of recent frames."""
+        if self._overlay_atlas is None:
+            from core.font import Font
+            from core.glyph_atlas import GlyphAtlas
+
+            font = Font("antiquity-print.ttf", 16, (255, 255, 255))
+            self._overlay_atlas = GlyphAtlas.for_font(font, charset="0123456789. pms")
+
+        rect = self.overlay_rect(surface)
+        surface.fill(OVERLAY_BACKGROUND, rect)
+
+        p50, p99 = self.percentiles(0.5, 0.99)
+        self._overlay_atlas.draw(
+            surface,
+            f"p50 {p50:.2f} ms  p99 {p99:.2f} ms",
+            (rect.x + 8, rect.y + 6),
+        )
+
+        # One column per recent frame, the graph's top is twice the budget
+        graph = pygame.Rect(rect.x + 8, rect.y + 30, rect.width - 16, rect.height - 38)
+        recent = list(self.frames)[-graph.width :]
+        scale = graph.height / (2 * self.budget_ms)
+        for i, (_, duration, _) in enumerate(recent):
+            frame_ms = duration * 1000
+            height = min(graph.height, max(1, round(frame_ms * scale)))
+            color = GRAPH_COLOR if frame_ms <= self.budget_ms else OVER_BUDGET_COLOR
+            x = graph.x + i
+            pygame.draw.line(
+                surface, color, (x, graph.bottom - 1), (x, graph.bottom - height)
+            )
+        budget_y = graph.bottom - round(self.budget_ms * scale)
+        pygame.draw.line(
+            surface, (255, 255, 255), (graph.x, budget_y), (graph.right - 1, budget_y)
+        )
+        return rect
+
+    def export_chrome_trace(self, path: str = None) -> str:
+        """Write the buffered frames as Chrome trace-event JSON.
+
+        The file opens in chrome://tracing, Perfetto or Speedscope.
+        """
+        if path is None:
+            os.makedirs(logs_dir, exist_ok=True)
+            stamp = time.strftime("%Y%m%d-%H%M%S")
+            path = os.path.join(logs_dir, f"frame-trace-{stamp}.json")
+
+        events = []
+        for index, (start, duration, scopes) in enumerate(self.frames):
+            events.append(_trace_event(f"frame {index}", start, duration, "frame"))
+            for name, scope_start, scope_duration, _ in scopes:
+                events.append(_trace_event(name, scope_start, scope_duration, "phase"))
+
+        with open(path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        logger.info(f"Wrote {len(self.frames)} frames to {path}")
+        return path
+
+    def summary(self) -> str:
+        p50, p99 = self.percentiles(0.5, 0.99)
+        return (
+            f"Frame profile of the last {len(self.frames)} frames: "
+            f"p50 {p50:.2f} ms, p99 {p99:.2f} ms"
+        )
+
+
+def _trace_event(name, start, duration, category) -> dict:
+    # Complete events, timestamps in microseconds
+    return {
+        "name": name,
+        "cat": category,
+        "ph": "X",
+        "ts": start * 1e6,
+        "dur": duration * 1e6,
+        "pid": os.getpid(),
+        "tid": 1,
+    }
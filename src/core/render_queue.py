@@ -0,0 +1,92 @@
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import lru_cache
+
+import pygame
+
+# Draw order of the render queue layers
+BACKGROUND_LAYER = 0
+SPRITE_LAYER = 1
+HUD_LAYER = 2
+
+
+@lru_cache(maxsize=64)
+def rect_surface(size: tuple[int, int], color, width: int = 0) -> pygame.Surface:
+    """A rectangle as a blittable surface, like `pygame.draw.rect` would draw it.
+
+    `width` 0 fills the rectangle, otherwise only a border that wide is drawn
+    and the inside is transparent.
+    """
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    pygame.draw.rect(surface, color, surface.get_rect(), width)
+    if pygame.display.get_surface() is not None:
+        surface = surface.convert_alpha()
+    return surface
+
+
+class RenderQueue:
+    """Collects the blits of a frame and submits them to the target at once.
+
+    The queue stands in for the target surface in `draw`/`render` methods, so
+    they queue their `blit` and `blits` calls instead of running them. On
+    `flush` the commands are ordered by layer, keeping the order they were
+    added in within a layer, and handed to the target in a single
+    `Surface.fblits` call when available and no command needs a source area
+    or blend flags, or a single `Surface.blits` call otherwise.
+    """
+
+    def __init__(self, target: pygame.Surface):
+        self.target = target
+        self._layers = defaultdict(list)
+        self._commands = self._layers[BACKGROUND_LAYER]
+        self._plain = True
+
+    def get_size(self) -> tuple[int, int]:
+        return self.target.get_size()
+
+    @contextmanager
+    def layer(self, layer: int):
+        """Queue the blits made inside the block on `layer`."""
+        previous = self._commands
+        self._commands = self._layers[layer]
+        try:
+            yield self
+        finally:
+            self._commands = previous
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        if area is None and not special_flags:
+            self._commands.append((source, dest))
+        else:
+            self._commands.append((source, dest, area, special_flags))
+            self._plain = False
+
+    def blits(self, blit_sequence, doreturn=True):
+        commands = self._commands
+        for command in blit_sequence:
+            commands.append(command)
+            if len(command) > 2:
+                self._plain = False
+
+    def flush(self):
+        """Submit every queued blit to the target and empty the queue."""
+        layers = self._layers
+        if len(layers) == 1:
+            commands = next(iter(layers.values()))
+        else:
+            commands = [
+                command for layer in sorted(layers) for command in layers[layer]
+            ]
+
+        if commands:
+            fblits = getattr(self.target, "fblits", None)
+            if fblits is not None and self._plain:
+                fblits(commands)
+            else:
+                self.target.blits(commands, doreturn=False)
+
+        # Emptied in place, so a flush inside a `layer` block keeps queueing
+        # on that block's layer
+        for queued in layers.values():
+            queued.clear()
+        self._plain = True
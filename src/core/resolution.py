@@ -0,0 +1,88 @@
+import pygame
+
+from core.logs import get_logger
+
+logger = get_logger("Resolution")
+
+# Render scales the adaptive mode steps through, from native resolution down.
+# Scaled frames are upscaled in software when presented. At 0.5 that is a
+# cheap whole-factor upscale, while the upscale from 0.75 costs more than
+# the pixels it saves, so those frames are slower than native ones (see the
+# "scenario.play presented at render scale" benchmarks).
+RENDER_SCALES = (1.0, 0.5)
+
+
+def scaled_size(size: tuple[int, int], scale: float) -> tuple[int, int]:
+    return max(1, round(size[0] * scale)), max(1, round(size[1] * scale))
+
+
+def scale_rect(rect: pygame.Rect, scale: float) -> pygame.Rect:
+    """Map a rectangle in game coordinates to logical screen coordinates."""
+    if scale == 1:
+        return rect
+    return pygame.Rect(
+        (round(rect.x * scale), round(rect.y * scale)),
+        scaled_size(rect.size, scale),
+    )
+
+
+class AdaptiveResolution:
+    """Picks the render scale from the measured frame time.
+
+    Frame times are averaged over windows of `window` frames. When a
+    window averages over the budget, the next lower scale is used. The scale
+    is only raised again when the average, grown by the extra pixels the
+    higher scale has to fill, would still leave `headroom` of the budget
+    free, so the scale does not flip back and forth.
+    """
+
+    def __init__(
+        self,
+        budget_ms: float,
+        scales=RENDER_SCALES,
+        start: float = 1.0,
+        window: int = 60,
+        headroom: float = 0.2,
+    ):
+        self.budget_ms = budget_ms
+        self.scales = tuple(sorted(scales, reverse=True))
+        self.level = min(
+            range(len(self.scales)), key=lambda i: abs(self.scales[i] - start)
+        )
+        self.window = window
+        self.headroom = headroom
+        self._frames = 0
+        self._total_ms = 0.0
+
+    @property
+    def scale(self) -> float:
+        return self.scales[self.level]
+
+    def record(self, frame_ms: float):
+        """Add a frame time, returning the new scale when it changes."""
+        self._frames += 1
+        self._total_ms += frame_ms
+        if self._frames < self.window:
+            return None
+
+        average_ms = self._total_ms / self._frames
+        self._frames = 0
+        self._total_ms = 0.0
+
+        level = self.level
+        if average_ms > self.budget_ms and level < len(self.scales) - 1:
+            level += 1
+        elif level > 0:
+            pixel_ratio = (self.scales[level - 1] / self.scales[level]) ** 2
+            if average_ms * pixel_ratio < self.budget_ms * (1 - self.headroom):
+                level -= 1
+
+        if level == self.level:
+            return None
+
+        logger.info(
+            f"Frame time {average_ms:.1f} ms against a {self.budget_ms:.1f} ms "
+            f"budget, render scale {self.scale} -> {self.scales[level]}"
+        )
+        self.level = level
+        return self.scale
@@ -0,0 +1,109 @@
+import math
+
+import pygame
+
+
+class ScrollingLayer:
+    """A horizontally repeating layer drawn from a pre-composited strip.
+
+    The tile is repeated once into a wrap-around strip at least one view
+    plus one tile wide, so every scroll position is a single blit of a
+    window into the strip, and tiles outside the view are never drawn.
+    The scroll offset is kept as a float so slow layers move smoothly.
+    A layer drawn at a render `scale` scrolls by game distances times that
+    scale, so it keeps pace with the game at any logical resolution.
+    """
+
+    # Strips are shared between layers built from the same tile
+    _strips = {}
+
+    def __init__(
+        self,
+        tile: pygame.Surface,
+        view_width: int,
+        height: int = None,
+        y: int = 0,
+        parallax: float = 1.0,
+        scale: float = 1.0,
+    ):
+        self.tile = tile
+        self.tile_width, tile_height = tile.get_size()
+        self.view_width = view_width
+        self.height = height or tile_height
+        self.y = y
+        self.parallax = parallax
+        self.scale = scale
+        self.offset = 0.0
+        self.previous_offset = 0.0
+
+        strip_width = (math.ceil(view_width / self.tile_width) + 1) * self.tile_width
+        self.strip = self._build_strip(tile, strip_width, self.height)
+
+    @classmethod
+    def _build_strip(cls, tile, width, height):
+        key = (tile, width, height)
+        strip = cls._strips.get(key)
+        if strip is None:
+            strip = pygame.Surface((width, height), pygame.SRCALPHA)
+            if pygame.display.get_surface() is not None:
+                strip = strip.convert_alpha()
+            tile_width, tile_height = tile.get_size()
+            for x in range(0, width, tile_width):
+                for y in range(0, height, tile_height):
+                    strip.blit(tile, (x, y))
+            cls._strips[key] = strip
+        return strip
+
+    def scroll(self, distance: float):
+        """Move the layer left by `distance` scaled by its parallax factor."""
+        self.previous_offset = self.offset
+        self.offset = (
+            self.offset + distance * self.parallax * self.scale
+        ) % self.tile_width
+
+    def follow(self, other: "ScrollingLayer"):
+        """Continue from the scroll position of a layer at another scale."""
+        ratio = self.scale / other.scale
+        self.offset = (other.offset * ratio) % self.tile_width
+        self.previous_offset = (other.previous_offset * ratio) % self.tile_width
+
+    @property
+    def source_x(self) -> int:
+        """Left edge of the visible window inside the strip."""
+        return int(self.offset) % self.tile_width
+
+    def draw(self, surface: pygame.Surface, offset_x: float = None, alpha=1.0):
+        """Draw the visible window of the strip.
+
+        `offset_x` places a tile origin at that screen x position instead of
+        using the layer's own scroll offset. Otherwise `alpha` interpolates
+        between the offsets before and after the last scroll.
+        """
+        if offset_x is None:
+            # Layers only scroll forwards, so the distance wraps around
+            distance = (self.offset - self.previous_offset) % self.tile_width
+            source_x = int(self.previous_offset + distance * alpha) % self.tile_width
+        else:
+            source_x = int(-offset_x) % self.tile_width
+        surface.blit(
+            self.strip, (0, self.y), (source_x, 0, self.view_width, self.height)
+        )
+
+
+class ParallaxScroller:
+    """Scrolls several layers together, each at its own parallax factor."""
+
+    def __init__(self, layers):
+        self.layers = list(layers)
+
+    def scroll(self, distance: float):
+        for layer in self.layers:
+            layer.scroll(distance)
+
+    def visible_state(self) -> tuple:
+        """Changes whenever any layer would draw different pixels."""
+        return tuple(layer.source_x for layer in self.layers)
+
+    def draw(self, surface: pygame.Surface, alpha=1.0):
+        for layer in self.layers:
+            layer.draw(surface, alpha=alpha)
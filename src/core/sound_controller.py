@@ -1,6 +1,4 @@
 import pygame
-import serial
-import numpy as np
 
 import struct
 import threading
@@ -11,6 +9,18 @@ from core.logs import get_logger
 
 logger = get_logger("SoundController")
 
+# numpy and pyserial are imported on first use, so startup does not pay
+# for them when no sensor is attached
+np = None
+
+
+def _import_numpy():
+    global np
+    if np is None:
+        import numpy
+
+        np = numpy
+
 
 class SoundController:
     # Singleton tracked instance
@@ -60,6 +70,9 @@ class SoundController:
         self.serial_thread.start()
 
     def update(self, value):
+        if np is None:
+            _import_numpy()
+
         self.window.append(value)
 
         if len(self.window) < self.window.maxlen // 2:
@@ -102,6 +115,8 @@ class SoundController:
     def _monitor_serial(self, port, baudrate):
         serial_obj = None
         try:
+            import serial
+
             # Open the serial port
             serial_obj = serial.Serial(port, baudrate)
             logger.info(f"Monitoring sound sensor on {port}...")
@@ -0,0 +1,174 @@
+import math
+from collections import deque
+
+from core.logs import get_logger
+from core.obstacle import BaseObstacle
+
+logger = get_logger("SpawnSchedule")
+
+# Obstacles generated at a time
+CHUNK_SIZE = 16
+
+# Gaps between spawns are drawn from this range of game time
+MIN_GAP_MS = 600
+MAX_GAP_MS = 1500
+
+# Draws for the next obstacle before its gap is widened to make it clearable
+MAX_DRAWS = 10
+
+# Steps of slack at either end of the part of a jump that clears an obstacle
+MARGIN_STEPS = 2
+
+
+class JumpArc:
+    """The player's jump in closed form, over simulation steps.
+
+    Each step the velocity changes by gravity before it moves the player,
+    so after `n` steps, the first being the step it jumps on, the player is
+    `-(v n + g n (n + 1) / 2)` above the ground.
+    """
+
+    def __init__(self, jump_velocity, gravity, left, right, margin=MARGIN_STEPS):
+        self.jump_velocity = jump_velocity
+        self.gravity = gravity
+        # The player's horizontal extent, which obstacles move through
+        self.left = left
+        self.right = right
+        self.margin = margin
+        # Steps until the player is back on the ground
+        self.airtime = math.ceil(-2 * jump_velocity / gravity - 1)
+
+    @classmethod
+    def for_player(cls, player):
+        return cls(player.jump_velocity, player.gravity, *player.extent())
+
+    def clearance(self, height: int):
+        """First and last number of steps after which the player is above `height`.
+
+        None if the jump does not get that high for long enough.
+        """
+        # height(n) > h  <=>  g/2 n^2 + (v + g/2) n + h < 0
+        a = self.gravity / 2
+        b = self.jump_velocity + a
+        discriminant = b * b - 4 * a * height
+        if discriminant <= 0:
+            return None
+        root = math.sqrt(discriminant)
+        first = math.floor((-b - root) / (2 * a)) + 1 + self.margin
+        last = math.ceil((-b + root) / (2 * a)) - 1 - self.margin
+        return (first, last) if first <= last else None
+
+
+class SpawnSchedule:
+    """The steps obstacles spawn at, generated ahead in seeded chunks.
+
+    Entries are `(step, obstacle_class, texture)`, counted in simulation
+    steps from the start of the schedule, and generated CHUNK_SIZE at a
+    time with `choose` and `rng`, so a seed always gives the same schedule.
+
+    Given the player's JumpArc, every obstacle is checked against a jump
+    plan. The obstacle has to be cleared by the jump planned for the one
+    before it, or by a new jump taken after that one lands. Obstacles that
+    cannot be cleared are drawn again, and after MAX_DRAWS the gap before
+    the last draw is widened to the shortest that can be cleared.
+    """
+
+    def __init__(self, choose, rng, step_ms, spawn_x, jump_arc=None):
+        self.choose = choose
+        self.rng = rng
+        self.step_ms = step_ms
+        self.spawn_x = spawn_x
+        self.jump_arc = jump_arc
+        self.entries = deque()
+        self._last_step = 0
+        self._takeoff = None
+        self._landing = -math.inf
+
+    def pop_due(self, step: int):
+        """The class and texture of the obstacle due at `step`, if any."""
+        if not self.entries:
+            self._generate_chunk()
+        if self.entries[0][0] > step:
+            return None
+        _, obstacle_class, texture = self.entries.popleft()
+        return obstacle_class, texture
+
+    def _generate_chunk(self):
+        for _ in range(CHUNK_SIZE):
+            self.entries.append(self._next_entry())
+        logger.debug(f"Scheduled obstacles up to step {self._last_step}")
+
+    def _gap_steps(self) -> int:
+        # An obstacle spawns on the first step after its gap has passed
+        gap_ms = self.rng.randint(MIN_GAP_MS, MAX_GAP_MS)
+        return math.floor(gap_ms / self.step_ms) + 1
+
+    def _next_entry(self) -> tuple:
+        for _ in range(MAX_DRAWS):
+            step = self._last_step + self._gap_steps()
+            obstacle_class, texture = self.choose()
+            if self.jump_arc is None or self._plan_jump(step, texture):
+                break
+        else:
+            step = self._clearable_step(step, texture)
+
+        self._last_step = step
+        return step, obstacle_class, texture
+
+    def _overlap(self, step: int, texture) -> tuple:
+        """First and last step an obstacle spawned at `step` is level with the player.
+
+        Collisions are swept, so that is while it moves over the player.
+        """
+        width = texture.get_width() if texture else 0
+        speed = BaseObstacle.SPEED
+        # Obstacles move once on the step they spawn
+        enter = step + math.floor((self.spawn_x - self.jump_arc.right) / speed)
+        leave = (
+            step + math.ceil((self.spawn_x + width - self.jump_arc.left) / speed) - 1
+        )
+        return enter, leave
+
+    def _plan_jump(self, step: int, texture) -> bool:
+        """Plan the jump over an obstacle, returning whether there is one.
+
+        A jump taken on step `t` has the player moving from `n = step - t`
+        to `n + 1` steps into the JumpArc during `step`, and both have to be
+        above the obstacle for every step it is level with the player.
+        """
+        clearance = self.jump_arc.clearance(texture.get_height() if texture else 0)
+        if clearance is None:
+            return False
+        first, last = clearance
+        enter, leave = self._overlap(step, texture)
+
+        takeoff = self._takeoff
+        if takeoff is not None and takeoff + first <= enter and leave < takeoff + last:
+            # Still above it from the jump over the previous obstacle
+            return True
+
+        # The earliest takeoff that stays above it for as long as it is level
+        # with the player, once the previous jump has landed
+        takeoff = max(leave + 1 - last, self._landing)
+        if takeoff + first > enter:
+            return False
+        self._takeoff = takeoff
+        self._landing = takeoff + self.jump_arc.airtime
+        return True
+
+    def _clearable_step(self, step: int, texture) -> int:
+        clearance = self.jump_arc.clearance(texture.get_height() if texture else 0)
+        if clearance is None:
+            logger.warning("Obstacle is too tall to jump over, scheduling it anyway")
+            return step
+        first, last = clearance
+        enter, leave = self._overlap(step, texture)
+        if leave - enter >= last - first:
+            logger.warning("Obstacle is too wide to jump over, scheduling it anyway")
+            return step
+
+        # Delay it until a jump taken after the previous landing clears it,
+        # which then always plans
+        step += max(0, self._landing + first - enter)
+        self._plan_jump(step, texture)
+        return step
@@ -0,0 +1,72 @@
+import pygame
+
+from core.assets import ImageRegistry
+from core.collision import MaskCache
+from core.logs import get_logger
+
+logger = get_logger("SpriteSheet")
+
+
+class SpriteSheet:
+    """The frames of an animation sprite sheet and their collision data.
+
+    Frames are sliced in row order and scaled once. For every frame, the
+    tight bounding box of its opaque pixels, its collision mask and the
+    offset of the box within the frame are baked into tables indexed by
+    frame number, so animations only look them up.
+    """
+
+    # Shared sheets, keyed by path, frame size and scale
+    _sheets = {}
+
+    @classmethod
+    def load(cls, path, frame_size: tuple, scale: int):
+        """Return the shared sheet, slicing it on first use.
+
+        Raises FileNotFoundError when the image is missing.
+        """
+        key = (str(path), tuple(frame_size), scale)
+        sheet = cls._sheets.get(key)
+        if sheet is None:
+            sheet = cls._sheets[key] = cls(path, frame_size, scale)
+        return sheet
+
+    def __init__(self, path, frame_size: tuple, scale: int):
+        registry = ImageRegistry.get_instance()
+        image = registry.load(path)
+
+        frame_width, frame_height = frame_size
+        sheet_width, sheet_height = image.get_size()
+        size = (frame_width * scale, frame_height * scale)
+        self.areas = tuple(
+            (col * frame_width, row * frame_height, frame_width, frame_height)
+            for row in range(sheet_height // frame_height)
+            for col in range(sheet_width // frame_width)
+        )
+        self.frames = tuple(registry.load(path, size, area) for area in self.areas)
+
+        masks = MaskCache.get_instance()
+        self.masks = tuple(masks.mask(frame) for frame in self.frames)
+        self.hitboxes = tuple(
+            masks.bounds(frame) if mask.count() else self._fallback_hitbox(frame)
+            for frame, mask in zip(self.frames, self.masks)
+        )
+        self.offsets = tuple(hitbox.topleft for hitbox in self.hitboxes)
+
+        # Everything any frame covers, in frame coordinates
+        self.extent = (
+            self.hitboxes[0].unionall(self.hitboxes[1:])
+            if self.hitboxes
+            else pygame.Rect(0, 0, 0, 0)
+        )
+
+        logger.debug(f"Loaded {len(self.frames)} frames from sprite sheet {path}")
+
+    def __len__(self):
+        return len(self.frames)
+
+    @staticmethod
+    def _fallback_hitbox(frame: pygame.Surface) -> pygame.Rect:
+        # A reasonable size for a frame without opaque pixels
+        frame_width, frame_height = frame.get_size()
+        return pygame.Rect(0, 0, frame_width // 2, frame_height // 2)
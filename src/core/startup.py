@@ -0,0 +1,152 @@
+import sys
+import time
+from contextlib import contextmanager
+from importlib.abc import MetaPathFinder
+
+from core.logs import get_logger
+
+logger = get_logger("Startup")
+
+
+class _TimedLoader:
+    """Wraps a module loader to time how long executing the module takes."""
+
+    def __init__(self, loader, report):
+        self._loader = loader
+        self._report = report
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        report = self._report
+        report._import_stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            cumulative = (time.perf_counter() - start) * 1000
+            nested = report._import_stack.pop()
+            if report._import_stack:
+                report._import_stack[-1] += cumulative
+            report.imports[module.__name__] = (cumulative - nested, cumulative)
+
+
+class _ImportTimer(MetaPathFinder):
+    """Meta path hook that wraps the loader of every newly imported module."""
+
+    def __init__(self, report):
+        self._report = report
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = _TimedLoader(spec.loader, self._report)
+                return spec
+        return None
+
+
+class _ImportBlocker(MetaPathFinder):
+    """Meta path hook that makes imports of some packages fail."""
+
+    def __init__(self, names):
+        self._names = names
+
+    def find_spec(self, fullname, path, target=None):
+        if fullname.partition(".")[0] in self._names:
+            raise ModuleNotFoundError(f"{fullname} is deferred", name=fullname)
+        return None
+
+
+@contextmanager
+def deferred_imports(*names: str):
+    """Make optional imports of the given packages fail inside the block.
+
+    Libraries that import these packages opportunistically fall back as if
+    they were missing, and the real import happens on first use later.
+    """
+    blocker = _ImportBlocker(names)
+    sys.meta_path.insert(0, blocker)
+    try:
+        yield
+    finally:
+        sys.meta_path.remove(blocker)
+
+
+class StartupReport:
+    """Import times and startup phase durations, up to the first frame."""
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.phases = []
+        self.imports = {}
+        self.first_frame_ms = None
+        self._import_stack = []
+        self._import_timer = None
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.origin) * 1000
+
+    def track_imports(self):
+        """Start timing every module imported from now on."""
+        if self._import_timer is None:
+            self._import_timer = _ImportTimer(self)
+            sys.meta_path.insert(0, self._import_timer)
+
+    def stop_tracking_imports(self):
+        if self._import_timer is not None:
+            sys.meta_path.remove(self._import_timer)
+            self._import_timer = None
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time a named startup phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, (time.perf_counter() - start) * 1000))
+
+    def phase_ms(self, name: str) -> float:
+        """Duration of the last completed phase called `name`, if any."""
+        for phase, duration in reversed(self.phases):
+            if phase == name:
+                return duration
+        return None
+
+    def finish(self, budget_ms: float = None):
+        """Record the first interactive frame and log the report."""
+        if self.first_frame_ms is not None:
+            return
+        self.first_frame_ms = self.elapsed_ms()
+        self.stop_tracking_imports()
+
+        lines = [
+            f"Startup report: first interactive frame at {self.first_frame_ms:.1f} ms"
+        ]
+        for name, duration in self.phases:
+            lines.append(f"  phase {name:<24} {duration:8.1f} ms")
+
+        slowest = sorted(self.imports.items(), key=lambda item: -item[1][0])[:15]
+        for name, (self_ms, cumulative_ms) in slowest:
+            lines.append(
+                f"  import {name:<23} {self_ms:8.1f} ms self {cumulative_ms:8.1f} ms total"
+            )
+        logger.info("\n".join(lines))
+
+        if budget_ms is not None and self.first_frame_ms > budget_ms:
+            logger.warning(
+                f"Startup took {self.first_frame_ms:.0f} ms, "
+                f"over the budget of {budget_ms:.0f} ms"
+            )
+
+
+# Created on first import so the origin is as close to process start as possible
+startup_report = StartupReport()
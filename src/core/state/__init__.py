@@ -1,5 +1,19 @@
+from importlib import import_module
+
 from .state import State
-from .game_over_state import GameOverState
-from .menu_state import MenuState
-from .play_state import PlayState
-from .pause_state import PauseState
+
+# States are imported on first use, so startup only pays for the initial one
+_lazy_states = {
+    "GameOverState": ".game_over_state",
+    "MenuState": ".menu_state",
+    "OptionsState": ".options_state",
+    "PlayState": ".play_state",
+    "PauseState": ".pause_state",
+}
+
+
+def __getattr__(name):
+    module_name = _lazy_states.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module_name, __name__), name)
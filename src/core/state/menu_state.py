@@ -2,7 +2,7 @@ import pygame
 
 from core.background import Background
 from core.font import Font
-from core.text import Text
+from core.menu_screen import MenuScreen
 from core.state import State
 from core.logs import get_logger
 
@@ -42,16 +42,40 @@ class MenuState(State):
             shadow_offset=(1, 1),
             shadow_color=(0, 0, 0),
         )
+        self.selected_option_font = self.option_font.with_color((255, 0, 0))
+
+        # Static labels
+        self.title_text = self.centered_text(
+            "Black Friday at Stonehenge", self.title_font, self.game.height // 4
+        )
+        self.instructions_text = self.centered_text(
+            "Use ARROW KEYS and ENTER to select",
+            self.instruction_font,
+            self.game.height - 100,
+        )
 
         # Menu options
         self.selected_option = 0  # 0: Start Game, 1: Options, 2: Quit
         self.options = ["Start Game", "Options", "Quit"]
 
+        # Background and labels are composited once, options are pre-rendered
+        self.menu_screen = MenuScreen(
+            self.game, self.background, [self.title_text, self.instructions_text]
+        )
+        for i, option in enumerate(self.options):
+            y = self.game.height // 2 + i * 60
+            self.menu_screen.add_option(
+                self.centered_text(option, self.option_font, y),
+                self.centered_text(option, self.selected_option_font, y),
+            )
+
     def handle_events(self):
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 logger.info("Quit event received")
                 self.game.running = False
+            elif event.type == pygame.WINDOWEXPOSED:
+                self.menu_screen.invalidate()
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_DOWN:
                     self.selected_option = (self.selected_option + 1) % len(
@@ -82,55 +106,5 @@ class MenuState(State):
         pass
 
     def render(self):
-        # Render the background
-        self.background.render(self.game.screen)
-
-        # Render the title
-        title_text = Text(
-            "Black Friday at Stonehenge",
-            self.title_font,
-            position=(
-                self.game.width // 2
-                - self.title_font.render("Black Friday at Stonehenge").get_width() // 2,
-                self.game.height // 4,
-            ),
-        )
-        title_text.render(self.game.screen)
-
-        # Render the options
-        for i, option in enumerate(self.options):
-            color = (255, 0, 0) if i == self.selected_option else (255, 255, 255)
-            option_font = Font(
-                "antiquity-print.ttf",
-                30,
-                color,
-                shadow=True,
-                shadow_offset=(2, 2),
-                shadow_color=(0, 0, 0),
-            )
-            option_text = Text(
-                option,
-                option_font,
-                position=(
-                    self.game.width // 2 - option_font.render(option).get_width() // 2,
-                    self.game.height // 2 + i * 60,
-                ),
-            )
-            option_text.render(self.game.screen)
-
-        # Render the instructions
-        instructions_text = Text(
-            "Use ARROW KEYS and ENTER to select",
-            self.instruction_font,
-            position=(
-                self.game.width // 2
-                - self.instruction_font.render(
-                    "Use ARROW KEYS and ENTER to select"
-                ).get_width()
-                // 2,
-                self.game.height - 100,
-            ),
-        )
-        instructions_text.render(self.game.screen)
-
-        pygame.display.flip()
+        # Only the parts that changed since the last frame are drawn
+        self.menu_screen.render(self.selected_option)
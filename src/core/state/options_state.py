@@ -1,9 +1,7 @@
 import pygame
-import serial
-import serial.tools.list_ports
 from core.background import Background
 from core.font import Font
-from core.text import Text
+from core.menu_screen import MenuScreen
 from core.state import State
 from core.logs import get_logger
 
@@ -44,6 +42,17 @@ class OptionsState(State):
             shadow_offset=(1, 1),
             shadow_color=(0, 0, 0),
         )
+        self.selected_option_font = self.option_font.with_color((255, 0, 0))
+
+        # Static labels
+        self.title_text = self.centered_text(
+            "SOUND OPTIONS", self.title_font, self.game.height // 8
+        )
+        self.instructions_text = self.centered_text(
+            "Use ARROW KEYS and ENTER to select, ESC to go back",
+            self.instruction_font,
+            self.game.height - 50,
+        )
 
         # Get available ports
         self.available_ports = self._get_available_ports()
@@ -55,10 +64,17 @@ class OptionsState(State):
         # Current port display
         self.current_port = f"Current Port: {game.sound_port}"
 
+        # Background and labels are composited once, ports are pre-rendered
+        self.menu_screen = MenuScreen(self.game, self.background)
+        self._update_labels()
+        self.visible_range = None
+
     def _get_available_ports(self):
         """Get list of available COM ports with descriptions"""
         ports = []
         try:
+            import serial.tools.list_ports
+
             for port in serial.tools.list_ports.comports():
                 port_desc = f"{port.device} - {port.description}"
                 ports.append((port_desc, port.device))
@@ -77,6 +93,8 @@ class OptionsState(State):
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.game.running = False
+            elif event.type == pygame.WINDOWEXPOSED:
+                self.menu_screen.invalidate()
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_DOWN:
                     self.selected_option = (self.selected_option + 1) % len(
@@ -103,6 +121,7 @@ class OptionsState(State):
 
             # Update the current port display
             self.current_port = f"Current Port: {self.game.sound_port}"
+            self._update_labels()
 
             # Reset sound controller to use new port
             from core.sound_controller import SoundController
@@ -117,36 +136,31 @@ class OptionsState(State):
     def update(self):
         pass
 
-    def render(self):
-        # Render the background
-        self.background.render(self.game.screen)
-
-        # Render the title
-        title_text = Text(
-            "SOUND OPTIONS",
-            self.title_font,
-            position=(
-                self.game.width // 2
-                - self.title_font.render("SOUND OPTIONS").get_width() // 2,
-                self.game.height // 8,
-            ),
+    def _update_labels(self):
+        current_port_text = self.centered_text(
+            self.current_port, self.option_font, self.game.height // 4
         )
-        title_text.render(self.game.screen)
-
-        # Render current port
-        current_port_text = Text(
-            self.current_port,
-            self.option_font,
-            position=(
-                self.game.width // 2
-                - self.option_font.render(self.current_port).get_width() // 2,
-                self.game.height // 4,
-            ),
+        self.menu_screen.set_labels(
+            [self.title_text, current_port_text, self.instructions_text]
         )
-        current_port_text.render(self.game.screen)
 
-        # Render available ports
+    def _update_visible_ports(self, start_idx, end_idx):
         port_y_start = self.game.height // 3
+
+        self.menu_screen.set_options([])
+        for i in range(start_idx, end_idx):
+            # Show a limited port name to fit on screen
+            display_text = self.available_ports[i][0]
+            if len(display_text) > 40:
+                display_text = display_text[:37] + "..."
+
+            y = port_y_start + (i - start_idx) * 50
+            self.menu_screen.add_option(
+                self.centered_text(display_text, self.option_font, y),
+                self.centered_text(display_text, self.selected_option_font, y),
+            )
+
+    def render(self):
         visible_items = 6  # Number of items visible at once
 
         # Calculate range of visible items
@@ -156,50 +170,10 @@ class OptionsState(State):
         # Adjust start_idx if we have fewer items at the end
         start_idx = max(0, min(start_idx, len(self.available_ports) - visible_items))
 
-        # Render the port options
-        for i in range(start_idx, end_idx):
-            port_info = self.available_ports[i]
-            is_selected = i == self.selected_option
-
-            color = (255, 0, 0) if is_selected else (255, 255, 255)
-            port_font = Font(
-                "antiquity-print.ttf",
-                30,
-                color,
-                shadow=True,
-                shadow_offset=(2, 2),
-                shadow_color=(0, 0, 0),
-            )
-
-            # Show a limited port name to fit on screen
-            display_text = port_info[0]
-            if len(display_text) > 40:
-                display_text = display_text[:37] + "..."
-
-            port_text = Text(
-                display_text,
-                port_font,
-                position=(
-                    self.game.width // 2
-                    - port_font.render(display_text).get_width() // 2,
-                    port_y_start + (i - start_idx) * 50,
-                ),
-            )
-            port_text.render(self.game.screen)
-
-        # Render the instructions
-        instructions_text = Text(
-            "Use ARROW KEYS and ENTER to select, ESC to go back",
-            self.instruction_font,
-            position=(
-                self.game.width // 2
-                - self.instruction_font.render(
-                    "Use ARROW KEYS and ENTER to select, ESC to go back"
-                ).get_width()
-                // 2,
-                self.game.height - 50,
-            ),
-        )
-        instructions_text.render(self.game.screen)
+        # Scrolling the port list redraws the whole screen
+        if (start_idx, end_idx) != self.visible_range:
+            self.visible_range = (start_idx, end_idx)
+            self._update_visible_ports(start_idx, end_idx)
 
-        pygame.display.flip()
+        # Only the parts that changed since the last frame are drawn
+        self.menu_screen.render(self.selected_option - start_idx)
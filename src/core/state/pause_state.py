@@ -1,17 +1,20 @@
 import pygame
 from core.background import Background
 from core.font import Font
-from core.text import Text
+from core.frame_pacing import LOW
+from core.menu_screen import MenuScreen
 from .state import State
 
 
 class PauseState(State):
+    FRAME_POLICY = LOW
+
     def __init__(self, game, play_state):
         super().__init__(game)
         self.play_state = play_state  # Keep for resuming the game
         self.selected_option = 0  # 0: Resume, 1: Restart, 2: Quit to Menu
         self.options = ["Resume", "Restart", "Quit to Menu"]
-        self.pause_start = pygame.time.get_ticks()  # Record when the pause started
+        self.game.game_clock.pause()  # Game time stands still until we leave
 
         # Background
         self.background = Background(image="menu_1.png")
@@ -41,22 +44,46 @@ class PauseState(State):
             shadow_offset=(1, 1),
             shadow_color=(0, 0, 0),
         )
+        self.selected_option_font = self.option_font.with_color((255, 0, 0))
+
+        # Static labels
+        self.title_text = self.centered_text(
+            "PAUSED", self.title_font, self.game.height // 4
+        )
+        self.instructions_text = self.centered_text(
+            "Use ARROW KEYS and ENTER to select",
+            self.instruction_font,
+            self.game.height - 100,
+        )
+
+        # Background and labels are composited once, options are pre-rendered
+        self.menu_screen = MenuScreen(
+            self.game, self.background, [self.title_text, self.instructions_text]
+        )
+        for i, option in enumerate(self.options):
+            y = self.game.height // 2 + i * 60
+            self.menu_screen.add_option(
+                self.centered_text(option, self.option_font, y),
+                self.centered_text(option, self.selected_option_font, y),
+            )
 
     def handle_events(self):
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.game.running = False
+            elif event.type == pygame.WINDOWEXPOSED:
+                self.menu_screen.invalidate()
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_p:  # Resume the game
                     self._resume_game()
                 elif event.key == pygame.K_r:  # Restart the game
                     from .play_state import PlayState
 
-                    self.game.set_state(PlayState(self.game))
+                    self._leave(PlayState(self.game))
                 elif event.key == pygame.K_q:  # Quit to menu
                     from .menu_state import MenuState
 
-                    self.game.set_state(MenuState(self.game))
+                    self._leave(MenuState(self.game))
                 elif event.key == pygame.K_DOWN:
                     self.selected_option = (self.selected_option + 1) % len(
                         self.options
@@ -74,73 +101,24 @@ class PauseState(State):
         elif self.selected_option == 1:
             from .play_state import PlayState
 
-            self.game.set_state(PlayState(self.game))
+            self._leave(PlayState(self.game))
         elif self.selected_option == 2:
             from .menu_state import MenuState
 
-            self.game.set_state(MenuState(self.game))
+            self._leave(MenuState(self.game))
 
     def _resume_game(self):
-        pause_duration = pygame.time.get_ticks() - self.pause_start
-        self.play_state.obstacle_manager.pause_accumulated_time += pause_duration
-
         from .play_state import PlayState
 
-        self.game.set_state(PlayState(self.game, self.play_state))
+        self._leave(PlayState(self.game, self.play_state))
+
+    def _leave(self, state):
+        self.game.game_clock.resume()
+        self.game.set_state(state)
 
     def update(self):
         pass
 
     def render(self):
-        # Render the background
-        self.background.render(self.game.screen)
-
-        # Render the title
-        title_text = Text(
-            "PAUSED",
-            self.title_font,
-            position=(
-                self.game.width // 2
-                - self.title_font.render("PAUSED").get_width() // 2,
-                self.game.height // 4,
-            ),
-        )
-        title_text.render(self.game.screen)
-
-        # Render the options
-        for i, option in enumerate(self.options):
-            color = (255, 0, 0) if i == self.selected_option else (255, 255, 255)
-            option_font = Font(
-                "antiquity-print.ttf",
-                30,
-                color,
-                shadow=True,
-                shadow_offset=(2, 2),
-                shadow_color=(0, 0, 0),
-            )
-            option_text = Text(
-                option,
-                option_font,
-                position=(
-                    self.game.width // 2 - option_font.render(option).get_width() // 2,
-                    self.game.height // 2 + i * 60,
-                ),
-            )
-            option_text.render(self.game.screen)
-
-        # Render the instructions
-        instructions_text = Text(
-            "Use ARROW KEYS and ENTER to select",
-            self.instruction_font,
-            position=(
-                self.game.width // 2
-                - self.instruction_font.render(
-                    "Use ARROW KEYS and ENTER to select"
-                ).get_width()
-                // 2,
-                self.game.height - 100,
-            ),
-        )
-        instructions_text.render(self.game.screen)
-
-        pygame.display.flip()
+        # Only the parts that changed since the last frame are drawn
+        self.menu_screen.render(self.selected_option)
@@ -3,18 +3,39 @@ import pygame
 from core.logs import get_logger
 from core.player import Player
 from core.obstacle_manager import ObstacleManager
+from core.spawn_schedule import JumpArc
 from core.ground import Ground
-from core.sound_controller import SoundController
 from core.state import State
 from core.state import GameOverState
+from core.dirty_renderer import DirtyRenderer, timed_render
 from core.font import Font
+from core.frame_pacing import PLAY
+from core.glyph_atlas import GlyphAtlas
+from core.resolution import scaled_size
+from core.render_queue import (
+    BACKGROUND_LAYER,
+    HUD_LAYER,
+    SPRITE_LAYER,
+    RenderQueue,
+)
 from core.text import Text
-from core.tiling_background import TilingBackground
+from core.scrolling_layer import ParallaxScroller
+from core.tiling_background import (
+    BRICKS_IMAGE,
+    BRICKS_UNIT_SIZE,
+    TilingBackground,
+)
 
 logger = get_logger("PlayState")
 
 
 class PlayState(State):
+    SCALES_RESOLUTION = True
+    FRAME_POLICY = PLAY
+    DEFERS_GC = True
+    BACKGROUND_IMAGE = BRICKS_IMAGE
+    BACKGROUND_UNIT_SIZE = BRICKS_UNIT_SIZE
+
     def __init__(self, game, previous_state=None):
         super().__init__(game)
 
@@ -34,48 +55,98 @@ class PlayState(State):
             "noise_floor": 100,
         }
 
-        # Get Singleton instance of sound controller
-        try:
-            self.sound_controller = SoundController.get_instance(
-                sound_config, self.player.jump
-            )
-            logger.info("Sound controller initialized or reused")
-        except Exception as e:
-            logger.error(f"Failed to initialize sound controller: {str(e)}")
-            self.sound_controller = None
+        # Get Singleton instance of sound controller, headless runs only
+        # take scripted input so they stay reproducible
+        self.sound_controller = None
+        if not self.game.headless:
+            try:
+                from core.sound_controller import SoundController
+
+                self.sound_controller = SoundController.get_instance(
+                    sound_config, self.player.jump
+                )
+                logger.info("Sound controller initialized or reused")
+            except Exception as e:
+                logger.error(f"Failed to initialize sound controller: {str(e)}")
 
         # Initialize obstacle manager
         if previous_state and hasattr(previous_state, "obstacle_manager"):
             self.obstacle_manager = previous_state.obstacle_manager
         else:
-            self.obstacle_manager = ObstacleManager(
-                self.game.width, self.game.height - 100
+            obstacle_manager_class = ObstacleManager
+            if self.game.obstacle_backend == "batch":
+                # Imported on demand, so numpy only loads for this backend
+                from core.obstacle_batch import ObstacleBatch
+
+                obstacle_manager_class = ObstacleBatch
+            self.obstacle_manager = obstacle_manager_class(
+                self.game.width,
+                self.game.height - 100,
+                self.game.game_clock,
+                self.game.rng,
+                # Obstacles are only scheduled where this jump clears them
+                JumpArc.for_player(self.player),
             )
 
         # Game state
         self.score = previous_state.score if previous_state else 0
         self.ground_level = self.game.height - 100
 
-        bg_scale = 16
+        # Scrolling attributes, the ground moves twice as fast as the wall
+        self.scroll_speed = 5
+        self.scroller = None
+
+        # Everything drawn is built for the logical resolution it is drawn at
+        self.render_scale = None
+        self._build_render_resources(self.game.render_scale)
+
+    def _build_render_resources(self, scale):
+        self.render_scale = scale
+        self.player.set_render_scale(scale)
+        self.obstacle_manager.set_render_scale(scale)
+
         # Initialize the tiling background
         self.background = TilingBackground(
-            image="background_bricks.png", unit_size=(50 * bg_scale, 33 * bg_scale)
+            image=self.BACKGROUND_IMAGE,
+            unit_size=self.BACKGROUND_UNIT_SIZE,
+            view_size=(self.game.width, self.game.height),
+            scale=scale,
         )
 
         # Fonts
         self.score_font = Font(
             "antiquity-print.ttf",
-            39,
+            round(39 * scale),
             (255, 255, 255),
             shadow=True,
-            shadow_offset=(2, 2),
+            shadow_offset=scaled_size((2, 2), scale),
         )
         self.pause_font = Font(
             "antiquity-print.ttf",
-            26,
+            round(26 * scale),
             (255, 255, 255),
             shadow=True,
-            shadow_offset=(3, 3),
+            shadow_offset=scaled_size((3, 3), scale),
+        )
+
+        # Score counters change often, so they are drawn from a glyph atlas
+        self.score_atlas = GlyphAtlas.for_font(
+            self.score_font, charset="Score: High0123456789"
+        )
+        self.score_position = scaled_size((20, 20), scale)
+        self.high_score_position = scaled_size((20, 90), scale)
+
+        # Static labels
+        pause_hint = "Press P or ESC to pause"
+        self.pause_text = Text(
+            pause_hint,
+            self.pause_font,
+            position=(
+                round(self.game.width * scale)
+                - self.pause_font.measure(pause_hint)[0]
+                - round(30 * scale),
+                round(20 * scale),
+            ),
         )
 
         # Initialize ground object
@@ -84,35 +155,41 @@ class PlayState(State):
             screen_height=self.game.height,
             ground_level=self.ground_level,
             image="ground_tile.png",
+            parallax=2,
+            scale=scale,
         )
 
-        # Scrolling attributes
-        self.scroll_speed = 5
-        self.background_offset = 0
-        self.ground_offset = 0
+        # Keep scrolling from where the layers of the previous scale were
+        layers = [self.background.layer, self.ground.layer]
+        if self.scroller is not None:
+            for layer, previous in zip(layers, self.scroller.layers):
+                layer.follow(previous)
+        self.scroller = ParallaxScroller(layers)
+
+        # Full-mode frames are queued and submitted in one batched blit call
+        self.render_queue = RenderQueue(self.game.screen)
+
+        # Built when the dirty-rectangle render mode is first used
+        self.dirty_renderer = None
 
     def update(self):
         self.player.update(self.ground_level)
         self.obstacle_manager.update()
 
-        passed_obstacles = self.obstacle_manager.get_passed_obstacles(
-            self.player.rect.left
-        )
-        self.score += passed_obstacles
-
-        # Check for collisions
-        if self.obstacle_manager.check_collisions(self.player.rect):
+        # Check for collisions before passed obstacles are scored and dropped,
+        # so ones that passed through the player during the step still hit
+        if self.obstacle_manager.check_collisions(*self.player.collision_shape()):
             self.game.high_score = max(self.game.high_score, self.score)
 
             self.game.set_state(GameOverState(self.game))
+        else:
+            passed_obstacles = self.obstacle_manager.get_passed_obstacles(
+                self.player.rect.left
+            )
+            self.score += passed_obstacles
 
         # Update scrolling offsets
-        self.background_offset = (self.background_offset - self.scroll_speed) % (
-            self.background.unit_size[0]
-        )
-        self.ground_offset = (self.ground_offset - 2 * self.scroll_speed) % (
-            self.ground.tile_width
-        )
+        self.scroller.scroll(self.scroll_speed)
 
     def handle_events(self):
         for event in pygame.event.get():
@@ -129,53 +206,75 @@ class PlayState(State):
                     self.game.set_state(PauseState(self.game, self))
                 elif event.key == pygame.K_SPACE:
                     self.player.jump()
+                elif event.key == pygame.K_F2:
+                    self.game.toggle_render_mode()
+                    self.dirty_renderer = None
+                elif event.key == pygame.K_F3:
+                    self.game.profiler.toggle_overlay()
+                elif event.key == pygame.K_F4:
+                    self.game.profiler.export_chrome_trace()
             elif event.type == pygame.USEREVENT and event.action == "SOUND_TRIGGER":
                 self.player.jump()
 
     def render(self):
-        # Render the scrolling background
-        for x in range(
-            -self.background.unit_size[0], self.game.width, self.background.unit_size[0]
+        if self.render_scale != self.game.display_scale:
+            self._build_render_resources(self.game.display_scale)
+        elif self.render_queue.target is not self.game.screen:
+            # The game's screen surface was replaced since the last frame
+            self.render_queue = RenderQueue(self.game.screen)
+            self.dirty_renderer = None
+
+        # Dirty rectangles are tracked in game coordinates, so scaled
+        # frames are always rendered in full, as are batched obstacles
+        if (
+            self.game.render_mode == "dirty"
+            and self.render_scale == 1
+            and self.obstacle_manager.HAS_OBSTACLE_OBJECTS
         ):
-            self.background.render(
-                self.game.screen, offset_x=x + self.background_offset
-            )
+            if self.dirty_renderer is None:
+                self.dirty_renderer = DirtyRenderer(self)
+            timed_render(self.game.render_stats["dirty"], self.dirty_renderer.render)
+        else:
+            timed_render(self.game.render_stats["full"], self._render_full)
+
+    def _render_full(self):
+        queue = self.render_queue
+        # Finer profiler scopes flush the queue when they end, so each one
+        # times the blits of its own part of the frame
+        detail = self.game.profiler.detail
 
-        # Render the scrolling ground
-        self.ground.render(self.game.screen, offset_x=self.ground_offset)
+        # Moving things are drawn between their last two simulation steps
+        alpha = self.game.game_clock.alpha
+
+        # Render the scrolling background and ground, one blit each
+        with queue.layer(BACKGROUND_LAYER):
+            with detail("background", queue.flush):
+                self.background.render(queue, alpha=alpha)
+            with detail("ground", queue.flush):
+                self.ground.render(queue, alpha=alpha)
 
         # Render the player and obstacles
-        self.player.draw(self.game.screen)
-        self.obstacle_manager.draw(self.game.screen)
-
-        # Render the score
-        score_text = Text(
-            f"Score: {self.score:03}",
-            self.score_font,
-            position=(20, 20),
-        )
-        score_text.render(self.game.screen)
-
-        # Render the high score
-        if self.game.high_score > 0:
-            high_score_text = Text(
-                f"High Score: {self.game.high_score:03}",
-                self.score_font,
-                position=(20, 90),
-            )
-            high_score_text.render(self.game.screen)
+        with queue.layer(SPRITE_LAYER):
+            with detail("player", queue.flush):
+                self.player.draw(queue, alpha=alpha)
+            with detail("obstacles", queue.flush):
+                self.obstacle_manager.draw(queue, alpha)
 
-        # Render the pause instructions
-        pause_text = Text(
-            "Press P or ESC to pause",
-            self.pause_font,
-            position=(
-                self.game.width
-                - self.pause_font.render("Press P or ESC to pause").get_width()
-                - 30,
-                20,
-            ),
-        )
-        pause_text.render(self.game.screen)
+        with queue.layer(HUD_LAYER), detail("hud", queue.flush):
+            # Render the score
+            self.score_atlas.draw(queue, f"Score: {self.score:03}", self.score_position)
+
+            # Render the high score
+            if self.game.high_score > 0:
+                self.score_atlas.draw(
+                    queue,
+                    f"High Score: {self.game.high_score:03}",
+                    self.high_score_position,
+                )
+
+            # Render the pause instructions
+            self.pause_text.render(queue)
 
-        pygame.display.flip()
+        queue.flush()
+        self.game.present()
+        return self.game.width * self.game.height, True
@@ -1,4 +1,18 @@
+from core.frame_pacing import IDLE
+from core.text import Text
+
+
 class State:
+    # Whether the state renders at the game's logical render scale
+    SCALES_RESOLUTION = False
+
+    # How the game loop paces frames of this state, see core.frame_pacing
+    FRAME_POLICY = IDLE
+
+    # Whether collections of the older GC generations wait for the next state
+    # transition while this state runs, see core.gc_policy
+    DEFERS_GC = False
+
     def __init__(self, game):
         self.game = game
 
@@ -10,3 +24,11 @@ class State:
 
     def render(self):
         raise NotImplementedError("Subclasses should implement this method")
+
+    def centered_text(self, text, font, y) -> Text:
+        """Build a Text horizontally centered on the screen."""
+        return Text(
+            text,
+            font,
+            position=(self.game.width // 2 - font.measure(text)[0] // 2, y),
+        )
@@ -11,6 +11,7 @@ class Text:
         self.position = position
         self.font = font
         self._length = len(text)
+        self.text_surface = None
 
     def __str__(self):
         return self.text
@@ -18,6 +19,17 @@ class Text:
     def __len__(self):
         return self._length
 
+    def set_text(self, text: str):
+        if text != self.text:
+            self.text = text
+            self._length = len(text)
+            self.text_surface = None
+
+    def get_size(self) -> Tuple[int, int]:
+        return self.font.measure(self.text)
+
     def render(self, screen: pygame.Surface):
-        self.text_surface = self.font.render(self.text)
+        # Rendered once, then every frame is a single blit
+        if self.text_surface is None:
+            self.text_surface = self.font.render(self.text)
         screen.blit(self.text_surface, (self.position[0], self.position[1]))
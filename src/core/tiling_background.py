@@ -1,20 +1,49 @@
-from pathlib import Path
 import pygame
 
+from core.assets import ImageRegistry, asset_path
+from core.resolution import scaled_size
+from core.scrolling_layer import ScrollingLayer
+
+# Brick wall drawn behind the play field, scaled 16x from its 50x33 unit
+BRICKS_IMAGE = "background_bricks.png"
+BRICKS_UNIT_SIZE = (50 * 16, 33 * 16)
+
 
 class TilingBackground:
-    def __init__(self, image: str, unit_size: tuple[int, int]):
-        self.image_path = (
-            Path(__file__).parent.parent.parent / "assets" / "backgrounds" / image
-        )
+    def __init__(
+        self,
+        image: str,
+        unit_size: tuple[int, int],
+        view_size: tuple[int, int] = None,
+        parallax: float = 1.0,
+        scale: float = 1.0,
+    ):
+        self.image_path = asset_path("backgrounds", image)
         self.unit_size = unit_size
-        self.tile_image = pygame.image.load(self.image_path).convert_alpha()
-        self.tile_image = pygame.transform.scale(self.tile_image, self.unit_size)
+        self.parallax = parallax
+        self.scale = scale
+        self.tile_image = ImageRegistry.get_instance().load(
+            self.image_path, scaled_size(self.unit_size, scale)
+        )
+
+        # Tiles are composited into a scrolling strip covering the view
+        self.layer = None
+        if view_size:
+            self._build_layer(scaled_size(view_size, scale))
+
+    def _build_layer(self, view_size: tuple[int, int]):
+        self.layer = ScrollingLayer(
+            self.tile_image,
+            view_size[0],
+            height=view_size[1],
+            parallax=self.parallax,
+            scale=self.scale,
+        )
 
-    def render(self, screen: pygame.Surface, offset_x=0):
-        screen_width, screen_height = screen.get_size()
+    def render(self, screen: pygame.Surface, offset_x=None, alpha=1.0):
+        if self.layer is None:
+            # Without a view size the layer covers the surface it is drawn on
+            self._build_layer(screen.get_size())
 
-        # Loop through the screen dimensions and draw tiles with offset
-        for x in range(-self.unit_size[0], screen_width, self.unit_size[0]):
-            for y in range(0, screen_height, self.unit_size[1]):
-                screen.blit(self.tile_image, (x + offset_x, y))
+        # One blit of the visible window, whatever the offset
+        self.layer.draw(screen, offset_x, alpha)
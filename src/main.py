@@ -1,4 +1,158 @@
-from core.game import Game
+import argparse
+import math
 
-game = Game(width=1366, height=768, title="Black Friday at Stonehenge")
-game.run()
+from core.startup import startup_report
+
+
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
+
+def positive_float(value: str) -> float:
+    number = float(value)
+    if not (number > 0 and math.isfinite(number)):
+        raise argparse.ArgumentTypeError(f"must be a positive number, got {value}")
+    return number
+
+
+def render_scale(value: str) -> float:
+    scale = positive_float(value)
+    if scale > 1:
+        raise argparse.ArgumentTypeError(f"must be at most 1, got {value}")
+    return scale
+
+
+parser = argparse.ArgumentParser(description="Black Friday at Stonehenge")
+parser.add_argument(
+    "--fast-startup",
+    action="store_true",
+    help="only initialize the pygame subsystems the game uses",
+)
+parser.add_argument(
+    "--startup-budget",
+    type=float,
+    metavar="MS",
+    help="warn when the first interactive frame takes longer than this",
+)
+parser.add_argument(
+    "--render-mode",
+    choices=("full", "dirty"),
+    default="full",
+    help="how PlayState presents frames (F2 toggles while playing)",
+)
+parser.add_argument(
+    "--render-scale",
+    type=render_scale,
+    default=1.0,
+    metavar="SCALE",
+    help="render gameplay at this fraction of the window size and upscale it",
+)
+parser.add_argument(
+    "--adaptive-resolution",
+    action="store_true",
+    help="lower the gameplay render scale while frames run over budget",
+)
+parser.add_argument(
+    "--max-fps",
+    type=positive_int,
+    default=120,
+    help="cap on rendered frames per second, gameplay speed does not change",
+)
+parser.add_argument(
+    "--time-scale",
+    type=positive_float,
+    default=1.0,
+    help="speed of game time relative to real time",
+)
+parser.add_argument(
+    "--vsync",
+    action="store_true",
+    help="pace gameplay frames with the display's vertical sync",
+)
+parser.add_argument(
+    "--headless",
+    action="store_true",
+    help="run without a window, uncapped, one simulation step per frame",
+)
+parser.add_argument(
+    "--seed",
+    type=int,
+    help="seed for gameplay randomness, for reproducible runs",
+)
+parser.add_argument(
+    "--frames",
+    type=int,
+    metavar="N",
+    help="stop after N frames",
+)
+parser.add_argument(
+    "--profile",
+    action="store_true",
+    help="time the phases of each frame and log a summary on exit",
+)
+parser.add_argument(
+    "--profile-details",
+    action="store_true",
+    help="also time the parts of gameplay rendering, e.g. background and HUD",
+)
+parser.add_argument(
+    "--profile-trace",
+    metavar="PATH",
+    help="write the profiled frames to a Chrome trace file on exit",
+)
+parser.add_argument(
+    "--track-allocations",
+    action="store_true",
+    help="count the memory allocated by each frame and report it on exit",
+)
+parser.add_argument(
+    "--no-gc-policy",
+    dest="gc_policy",
+    action="store_false",
+    help="leave garbage collection to CPython's defaults, to compare pauses",
+)
+parser.add_argument(
+    "--obstacle-backend",
+    choices=("objects", "batch"),
+    default="objects",
+    help="obstacle storage, batch keeps them in NumPy arrays for dense fields",
+)
+args = parser.parse_args()
+
+startup_report.track_imports()
+with startup_report.phase("import core.game"):
+    if args.fast_startup:
+        from core.startup import deferred_imports
+
+        # pygame imports numpy for surfarray/sndarray, which the game does not
+        # use. Hide it so numpy only loads once a sound sensor needs it.
+        with deferred_imports("numpy"):
+            import pygame  # noqa: F401
+
+    from core.game import Game
+
+game = Game(
+    width=1366,
+    height=768,
+    title="Black Friday at Stonehenge",
+    fast_startup=args.fast_startup,
+    startup_budget_ms=args.startup_budget,
+    render_mode=args.render_mode,
+    render_scale=args.render_scale,
+    adaptive_resolution=args.adaptive_resolution,
+    max_fps=args.max_fps,
+    time_scale=args.time_scale,
+    vsync=args.vsync,
+    headless=args.headless,
+    seed=args.seed,
+    profile=args.profile,
+    profile_details=args.profile_details,
+    profile_trace=args.profile_trace,
+    track_allocations=args.track_allocations,
+    gc_policy=args.gc_policy,
+    obstacle_backend=args.obstacle_backend,
+)
+game.run(max_frames=args.frames)
@@ -0,0 +1,15 @@
+import os
+
+# Tests run without a window or audio device
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+import pytest
+
+
+@pytest.fixture(autouse=True, scope="session")
+def pygame_init():
+    pygame.init()
+    yield
+    pygame.quit()
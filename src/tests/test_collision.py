@@ -0,0 +1,148 @@
+import random
+
+import pygame
+import pytest
+
+from core.collision import sweep
+from core.game import Game
+from core.game_clock import GameClock
+from core.obstacle import BaseObstacle, SmallObstacle
+from core.obstacle_manager import ObstacleManager
+from core.state.game_over_state import GameOverState
+from core.state.play_state import PlayState
+
+# Pixels obstacles move per step, up to steps that jump clean over the player
+STEP_SIZES = (10, 60, 250)
+
+BACKENDS = ("objects", "batch")
+
+GROUND_LEVEL = 668
+
+# A player standing on the ground, the size of a player frame's hitbox
+PLAYER_RECT = pygame.Rect(100, GROUND_LEVEL - 90, 75, 90)
+
+
+@pytest.fixture(params=STEP_SIZES)
+def step_size(request, monkeypatch):
+    monkeypatch.setattr(BaseObstacle, "SPEED", request.param)
+    return request.param
+
+
+def _obstacle_manager(backend: str):
+    if backend == "batch":
+        pytest.importorskip("numpy")
+        from core.obstacle_batch import ObstacleBatch
+
+        return ObstacleBatch(1366, GROUND_LEVEL, GameClock(), random.Random(0))
+    return ObstacleManager(1366, GROUND_LEVEL, GameClock(), random.Random(0))
+
+
+def _place_obstacle(manager, x: int) -> pygame.Surface:
+    """Add a small obstacle with its left edge at `x`."""
+    texture = manager.textures["small"][0]
+    if manager.HAS_OBSTACLE_OBJECTS:
+        obstacle = manager._spawn_obstacle(SmallObstacle, texture)
+        obstacle.reset(x, manager.ground_level - texture.get_height(), texture)
+        manager.obstacles.append(obstacle)
+    else:
+        manager.add(x, texture)
+    return texture
+
+
+@pytest.mark.parametrize("step", STEP_SIZES)
+def test_sweep_finds_overlap_during_step(step):
+    # A 20 px wide rectangle moving left past a static one, 5 px right of it
+    player = pygame.Rect(100, 0, 50, 50)
+    start = pygame.Rect(155, 0, 20, 50)
+    end = start.move(-step, 0)
+
+    entry, exit = sweep(player, player, start, end)
+
+    assert entry == pytest.approx(5 / step)
+    assert exit == pytest.approx(min(1.0, 75 / step))
+
+
+def test_sweep_misses_rectangles_that_do_not_meet():
+    player = pygame.Rect(100, 0, 50, 50)
+    start = pygame.Rect(300, 0, 20, 50)
+
+    assert sweep(player, player, start, start.move(-100, 0)) is None
+    # Passing above the player
+    above = start.move(0, -60)
+    assert sweep(player, player, above, above.move(-250, 0)) is None
+
+
+def test_sweep_of_static_overlap_spans_whole_step():
+    player = pygame.Rect(100, 0, 50, 50)
+    other = pygame.Rect(120, 10, 20, 20)
+
+    assert sweep(player, player, other, other) == (0.0, 1.0)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_time_of_impact(backend, step_size):
+    manager = _obstacle_manager(backend)
+    _place_obstacle(manager, PLAYER_RECT.right + 5)
+    manager.update()
+
+    impact = manager.time_of_impact(PLAYER_RECT, PLAYER_RECT)
+
+    assert impact == pytest.approx(5 / step_size)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_time_of_impact_without_hit(backend, step_size):
+    manager = _obstacle_manager(backend)
+    _place_obstacle(manager, PLAYER_RECT.right + step_size + 5)
+    manager.update()
+
+    assert manager.time_of_impact(PLAYER_RECT, PLAYER_RECT) is None
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_check_collisions_swept_over_step(backend, step_size):
+    manager = _obstacle_manager(backend)
+    _place_obstacle(manager, PLAYER_RECT.right + 5)
+    manager.update()
+
+    assert manager.check_collisions(PLAYER_RECT, previous_rect=PLAYER_RECT)
+
+    # Testing only where the step ended misses obstacles that tunneled
+    tunneled = manager.check_collisions(PLAYER_RECT)
+    assert tunneled == (step_size < 5 + PLAYER_RECT.width + 64)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_check_collisions_misses_obstacle_jumped_over(backend, step_size):
+    manager = _obstacle_manager(backend)
+    _place_obstacle(manager, PLAYER_RECT.right + 5)
+    manager.update()
+
+    high = PLAYER_RECT.move(0, -200)
+    assert not manager.check_collisions(high, previous_rect=high)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_play_state_hits_obstacle_that_tunneled(backend, monkeypatch):
+    # One step carries the obstacle from right of the player to left of it,
+    # and its right edge past the left of the screen
+    monkeypatch.setattr(BaseObstacle, "SPEED", 250)
+    game = Game(
+        width=1366,
+        height=768,
+        headless=True,
+        preload=False,
+        seed=0,
+        gc_policy=False,
+        obstacle_backend=backend,
+    )
+    state = PlayState(game)
+    game.set_state(state)
+    player = state.player
+    _place_obstacle(state.obstacle_manager, player.rect.right + 5)
+
+    state.update()
+    game.gc_policy.close()
+
+    assert isinstance(game.state, GameOverState)
+    assert state.score == 0
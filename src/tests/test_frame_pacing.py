@@ -0,0 +1,33 @@
+import threading
+
+import pygame
+
+from core.frame_pacing import FramePacer
+
+
+def test_idle_wait_keeps_the_order_of_events():
+    pygame.event.clear()
+    keys = [pygame.K_SPACE, pygame.K_p, pygame.K_ESCAPE]
+
+    def press_keys():
+        for key in keys:
+            pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key))
+            pygame.event.post(pygame.event.Event(pygame.KEYUP, key=key))
+
+    poster = threading.Timer(0.05, press_keys)
+    poster.start()
+    try:
+        assert FramePacer._wait_for_event()
+    finally:
+        poster.join()
+
+    events = [
+        (event.type, event.key)
+        for event in pygame.event.get()
+        if event.type in (pygame.KEYDOWN, pygame.KEYUP)
+    ]
+    assert events == [
+        (event_type, key)
+        for key in keys
+        for event_type in (pygame.KEYDOWN, pygame.KEYUP)
+    ]
@@ -0,0 +1,39 @@
+import gc
+import weakref
+
+from core.game import Game
+from core.gc_policy import DEFERRED_THRESHOLDS, GCPolicy
+from core.state.game_over_state import GameOverState
+from core.state.play_state import PlayState
+
+
+def test_game_is_collectable_after_close():
+    game = Game(width=640, height=480, headless=True, preload=False, seed=0)
+    game.run(max_frames=3)
+    game_ref = weakref.ref(game)
+    del game
+
+    gc.collect()
+
+    assert game_ref() is None
+    assert gc.get_freeze_count() == 0
+
+
+def test_collects_only_when_entering_states_that_do_not_defer():
+    policy = GCPolicy()
+    thresholds = gc.get_threshold()
+    try:
+        policy.enter_state(PlayState.__new__(PlayState))
+        assert policy.stats["PlayState"].scheduled == 0
+        assert gc.get_threshold() == DEFERRED_THRESHOLDS
+
+        policy.enter_state(GameOverState.__new__(GameOverState))
+        assert policy.stats["GameOverState"].scheduled == 1
+        assert gc.get_threshold() == thresholds
+
+        policy.enter_state(PlayState.__new__(PlayState))
+        assert policy.stats["PlayState"].scheduled == 0
+    finally:
+        policy.close()
+
+    assert gc.get_threshold() == thresholds